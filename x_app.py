@@ -1,9 +1,10 @@
-import sys, os, importlib, inspect
+import sys, os, io, re, collections, itertools
 import streamlit as st
 from pathlib import Path
-import pandas as pd
 import time
 
+# pandas is imported where it's used so the first paint doesn't wait on it
+
 # Prefer local dir for imports
 sys.path.insert(0, os.path.dirname(__file__))
 
@@ -12,68 +13,131 @@ st.title("🧵 X (Twitter) Auto Commenter – Enhanced UI")
 
 # Initialize session state
 if "logs" not in st.session_state:
-    st.session_state["logs"] = []
+    st.session_state["logs"] = collections.deque(maxlen=200)  # Keep last 200 logs
 if "processing" not in st.session_state:
     st.session_state["processing"] = False
 
+def get_upload_bytes(file) -> bytes:
+    """Copy the upload's bytes out of the widget once per upload and reuse them across reruns"""
+    cached = st.session_state.get("upload_bytes")
+    if cached is None or file.file_id not in cached:
+        cached = {file.file_id: file.getvalue()}
+        st.session_state["upload_bytes"] = cached
+    return cached[file.file_id]
+
 # UI Components
 uploaded_file = st.file_uploader("1️⃣ Upload your Excel/CSV", type=["xlsx", "csv"])
+upload_bytes = get_upload_bytes(uploaded_file) if uploaded_file else None
 delay = st.slider("2️⃣ Delay between comments (seconds)", 0.5, 5.0, 1.5, 0.1)
 profile = st.text_input("3️⃣ (Optional) Chrome profile folder")
 headless = st.checkbox("Run headless (no visible browser)", value=False)
+workers = st.number_input("Parallel browsers (share the login session)", min_value=1, max_value=8, value=1, step=1)
 
-# Progress tracking
-progress_container = st.container()
-log_container = st.container()
+# Log display is redrawn in batches rather than on every message
+LOG_FLUSH_EVERY = 10
+LOG_FLUSH_INTERVAL = 0.25
+LOG_DISPLAY_LINES = 50
+_log_flush = {"pending": 0, "at": 0.0}
+
+def flush_logs() -> None:
+    """Redraw the live log box with the latest messages"""
+    logs = st.session_state["logs"]
+    recent = itertools.islice(logs, max(len(logs) - LOG_DISPLAY_LINES, 0), None)
+    log_box.code("\n".join(recent), language=None)
+    _log_flush["pending"] = 0
+    _log_flush["at"] = time.monotonic()
 
 def ui_log(msg: str) -> None:
     """Enhanced logging with timestamp and better formatting"""
     timestamp = time.strftime("%H:%M:%S")
     formatted_msg = f"[{timestamp}] {str(msg)}"
     
-    prev = st.session_state.get("logs", [])
-    prev.append(formatted_msg)
-    st.session_state["logs"] = prev[-200:]  # Keep last 200 logs
+    st.session_state["logs"].append(formatted_msg)
     
     # Update log display
-    with log_container:
-        st.text_area("📋 Live Logs", 
-                    value="\n".join(st.session_state["logs"]), 
-                    height=300, 
-                    key=f"logs_{len(st.session_state['logs'])}")
+    _log_flush["pending"] += 1
+    if _log_flush["pending"] >= LOG_FLUSH_EVERY or time.monotonic() - _log_flush["at"] >= LOG_FLUSH_INTERVAL:
+        flush_logs()
+
+_STATUS_RE = re.compile(r"status|commented|done|posted", re.I)
+_YES_SET = frozenset({"Y", "YES", "TRUE", "1"})
+_PROGRESS_RE = re.compile(r"(\d+)\s*/\s*(\d+)")
+PREVIEW_ROWS = 3
+
+def is_done(value) -> bool:
+    """True if a status cell marks the row as already commented"""
+    return str(value).strip().upper() in _YES_SET
+
+def count_rows(file, col_pos: int, engine=None, encoding=None):
+    """Count data rows and rows already marked as commented, reading a single column"""
+    import pandas as pd
 
-def preview_columns(file):
+    file.seek(0)
+    if engine is None:
+        chunks = pd.read_csv(file, usecols=[col_pos], dtype=str, encoding=encoding, chunksize=50_000)
+    else:
+        chunks = [pd.read_excel(file, engine=engine, sheet_name=0, usecols=[col_pos], dtype=str)]
+
+    rows = already = 0
+    for chunk in chunks:
+        rows += len(chunk)
+        already += int(chunk.iloc[:, 0].map(is_done).sum())
+    return rows, already
+
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def _load_preview(file_bytes: bytes, ext: str, nrows: int = PREVIEW_ROWS):
+    """Parse the sample rows and row counts of an upload; cached on the file content"""
+    import pandas as pd
+
+    file = io.BytesIO(file_bytes)
+    engine = encoding = None
+    if ext == "csv":
+        # Try different encodings for CSV
+        for encoding in ["utf-8", "latin1", "cp1252"]:
+            try:
+                file.seek(0)
+                df = pd.read_csv(file, encoding=encoding, nrows=nrows)
+                loaded_msg = f"✅ CSV file loaded successfully with {encoding} encoding"
+                break
+            except Exception:
+                continue
+        else:
+            raise ValueError("Could not read CSV file with any encoding")
+    else:
+        # Try different engines for Excel (calamine is much faster; openpyxl if it's not installed)
+        excel_engines = ["calamine", "openpyxl"]
+        for engine in excel_engines:
+            try:
+                file.seek(0)
+                df = pd.read_excel(file, engine=engine, sheet_name=0, nrows=nrows)
+                loaded_msg = f"✅ Excel file loaded successfully with {engine} engine"
+                break
+            except Exception as e:
+                if engine == excel_engines[-1]:  # Last attempt
+                    raise ValueError(f"Could not read Excel file: {e}") from e
+                continue
+
+    # Only the first rows were parsed above; count the rest from a single column
+    status_col = next((col for col in df.columns if _STATUS_RE.search(str(col))), None)
+    total_rows, already_commented = 0, 0
+    if len(df.columns) > 0:
+        count_col = status_col if status_col is not None else df.columns[0]
+        total_rows, already_commented = count_rows(file, list(df.columns).index(count_col), engine, encoding)
+
+    return df, loaded_msg, total_rows, already_commented, status_col
+
+def preview_columns(file_bytes: bytes, name: str):
     """Enhanced file preview with better error handling"""
     try:
-        if file.name.lower().endswith(".csv"):
-            # Try different encodings for CSV
-            for encoding in ["utf-8", "latin1", "cp1252"]:
-                try:
-                    df = pd.read_csv(file, encoding=encoding)
-                    st.success(f"✅ CSV file loaded successfully with {encoding} encoding")
-                    break
-                except Exception:
-                    continue
-            else:
-                st.error("❌ Could not read CSV file with any encoding")
-                return
-        else:
-            # Try different engines for Excel
-            for engine in ["openpyxl", None]:
-                try:
-                    df = pd.read_excel(file, engine=engine, sheet_name=0)
-                    st.success(f"✅ Excel file loaded successfully with {engine or 'auto'} engine")
-                    break
-                except Exception as e:
-                    if engine is None:  # Last attempt
-                        st.error(f"❌ Could not read Excel file: {e}")
-                        return
-                    continue
+        df, loaded_msg, total_rows, already_commented, status_col = _load_preview(
+            file_bytes, name.rsplit(".", 1)[-1].lower()
+        )
+        st.success(loaded_msg)
         
         # Display file info
         col1, col2 = st.columns(2)
         with col1:
-            st.info(f"📊 **Rows:** {len(df)}")
+            st.info(f"📊 **Rows:** {total_rows}")
         with col2:
             st.info(f"📋 **Columns:** {len(df.columns)}")
         
@@ -87,21 +151,18 @@ def preview_columns(file):
                 st.write(f"  {i}. `{col_clean}` 🔗 (URL column)")
             elif "comment" in col_clean.lower():
                 st.write(f"  {i}. `{col_clean}` 💬 (Comment column)")
-            elif any(x in col_clean.lower() for x in ["status", "commented", "done", "posted"]):
+            elif _STATUS_RE.search(col_clean):
                 st.write(f"  {i}. `{col_clean}` ✅ (Status column)")
             else:
                 st.write(f"  {i}. `{col_clean}`")
         
         # Show sample data
         if len(df) > 0:
-            st.write("**Sample data (first 3 rows):**")
-            st.dataframe(df.head(3), use_container_width=True)
+            st.write(f"**Sample data (first {PREVIEW_ROWS} rows):**")
+            st.dataframe(df, use_container_width=True)
             
             # Check for already commented rows
-            status_cols = [col for col in df.columns if any(x in str(col).lower() for x in ["status", "commented", "done", "posted"])]
-            if status_cols:
-                status_col = status_cols[0]
-                already_commented = df[status_col].astype(str).str.upper().str.strip().isin(["Y", "YES", "TRUE", "1"]).sum()
+            if status_col is not None:
                 if already_commented > 0:
                     st.warning(f"⚠️ {already_commented} rows are already marked as commented and will be skipped")
                 else:
@@ -113,27 +174,54 @@ def preview_columns(file):
 # File preview
 if uploaded_file:
     with st.expander("📁 File Preview", expanded=True):
-        preview_columns(uploaded_file)
+        preview_columns(upload_bytes, uploaded_file.name)
 
 # Run button and processing
 run_btn = st.button("🚀 Run Bot", disabled=st.session_state.get("processing", False))
 
-def import_x_bot():
-    """Enhanced bot import with better error handling"""
-    candidates = [
-        ("x_commenter_bot_fixed.py", ["XCommentBot"]),
-        ("x_commenter_adapted.py", ["XCommentBot", "Bot"]),
-        ("x_commenter_bot.py", ["XCommentBot", "Bot"]),
-        ("twitter_commenter.py", ["TwitterCommentBot", "Bot"]),
-    ]
-    
+BOT_CANDIDATES = [
+    ("x_commenter_bot_fixed.py", ["XCommentBot"]),
+    ("x_commenter_adapted.py", ["XCommentBot", "Bot"]),
+    ("x_commenter_bot.py", ["XCommentBot", "Bot"]),
+    ("twitter_commenter.py", ["TwitterCommentBot", "Bot"]),
+]
+
+BOT_DIR = Path(__file__).parent
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _bot_dir_listing(dir_mtime: float) -> frozenset:
+    """File names next to the app; keyed on the directory mtime so added/removed files show up"""
+    return frozenset(os.listdir(BOT_DIR))
+
+def _bot_mtime() -> float:
+    """Latest mtime of the candidate bot modules; part of the import cache key"""
+    listing = _bot_dir_listing(BOT_DIR.stat().st_mtime)
+    mtime = 0.0
+    for fname, _ in BOT_CANDIDATES:
+        if fname not in listing:
+            continue
+        try:
+            mtime = max(mtime, (BOT_DIR / fname).stat().st_mtime)
+        except OSError:
+            continue
+    return mtime
+
+@st.cache_resource(show_spinner=False)
+def _load_bot_class(mtime: float):
+    """Import the bot module once per process (re-imported when a candidate file changes)
+
+    Returns (BotClass, file name, constructor signature, run() signature).
+    """
+    import importlib.util
+    import inspect
+
+    listing = _bot_dir_listing(BOT_DIR.stat().st_mtime)
     last_err = None
-    for fname, class_names in candidates:
-        path = Path(__file__).parent / fname
-        if not path.exists():
+    for fname, class_names in BOT_CANDIDATES:
+        if fname not in listing:
             continue
+        path = BOT_DIR / fname
         try:
-            import importlib.util
             spec = importlib.util.spec_from_file_location("x_bot_module", path)
             mod = importlib.util.module_from_spec(spec)
             sys.modules["x_bot_module"] = mod
@@ -141,30 +229,59 @@ def import_x_bot():
             
             for cname in class_names:
                 if hasattr(mod, cname):
-                    ui_log(f"✅ Successfully loaded {cname} from {fname}")
-                    return getattr(mod, cname), fname
+                    BotClass = getattr(mod, cname)
+                    return BotClass, fname, inspect.signature(BotClass), inspect.signature(BotClass.run)
         except Exception as e:
-            last_err = e
-            ui_log(f"❌ Failed to load {fname}: {e}")
+            last_err = RuntimeError(f"Failed to load {fname}: {e}")
             continue
     
     if last_err:
         raise last_err
     raise FileNotFoundError("Could not find an X bot module. Expected one of: x_commenter_bot_fixed.py, x_commenter_adapted.py, x_commenter_bot.py, twitter_commenter.py")
 
+def import_x_bot():
+    """Enhanced bot import with better error handling"""
+    loaded = _load_bot_class(_bot_mtime())
+    ui_log(f"✅ Successfully loaded {loaded[0].__name__} from {loaded[1]}")
+    return loaded
+
+def accepted_kwargs(sig, kwargs: dict) -> dict:
+    """Subset of kwargs that a callable with this signature accepts"""
+    params = sig.parameters
+    if any(p.kind is p.VAR_KEYWORD for p in params.values()):
+        return dict(kwargs)
+    return {k: v for k, v in kwargs.items() if k in params}
+
+def latest_processed_file():
+    """Newest processed_*.xlsx/.csv in the working directory, found in a single scandir pass"""
+    best, best_mtime = None, -1.0
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if entry.name.startswith("processed_") and entry.name.endswith((".xlsx", ".csv")):
+                mtime = entry.stat().st_mtime
+                if mtime > best_mtime:
+                    best, best_mtime = Path(entry.path), mtime
+    return best
+
 if run_btn and uploaded_file:
     st.session_state["processing"] = True
+
+    # Progress and log widgets only exist while a run is in progress
+    progress_container = st.container()
+    log_container = st.container()
+    with log_container:
+        log_box = st.empty()
     
     # Save upload locally so Selenium can read path
     local_path = Path("temp_upload" + (".csv" if uploaded_file.name.lower().endswith(".csv") else ".xlsx"))
     
     try:
-        # Reset file pointer and save
-        uploaded_file.seek(0)
-        local_path.write_bytes(uploaded_file.read())
+        # The bytes are already held in session state, so write them out directly
+        local_path.write_bytes(upload_bytes)
         ui_log(f"📁 Saved uploaded file to: {local_path}")
     except Exception as e:
         st.error(f"❌ Failed to save uploaded file: {e}")
+        flush_logs()
         st.session_state["processing"] = False
         st.stop()
 
@@ -177,12 +294,13 @@ if run_btn and uploaded_file:
     st.info("🌐 Chrome will open ➜ sign in to X (Twitter). Keep this page open. You will see live logs below.")
 
     try:
-        BotClass, fname = import_x_bot()
+        BotClass, fname, init_sig, run_sig = import_x_bot()
         ui_log(f"🤖 Loaded bot from {fname}")
         progress_bar.progress(10)
         status_text.text("🤖 Bot loaded successfully")
     except Exception as e:
         st.error(f"❌ Could not import your X bot: {e}")
+        flush_logs()
         st.session_state["processing"] = False
         st.stop()
 
@@ -191,32 +309,18 @@ if run_btn and uploaded_file:
         progress_bar.progress(20)
         status_text.text("⚙️ Setting up bot configuration...")
         
-        # Try different initialization signatures
-        bot = None
-        init_attempts = [
-            lambda: BotClass(delay=delay, profile_path=profile or None, headless=headless),
-            lambda: BotClass(delay=delay, profile_path=profile or None),
-            lambda: BotClass(delay=delay),
-            lambda: BotClass()
-        ]
-        
-        for i, init_func in enumerate(init_attempts):
-            try:
-                bot = init_func()
-                ui_log(f"✅ Bot initialized with method {i+1}")
-                break
-            except TypeError as e:
-                ui_log(f"⚠️ Init method {i+1} failed: {e}")
-                continue
-        
-        if bot is None:
-            raise Exception("Could not initialize bot with any method")
+        # Pass only the settings the bot's constructor accepts
+        settings = {"delay": delay, "profile_path": profile or None, "headless": headless, "workers": int(workers)}
+        init_kwargs = accepted_kwargs(init_sig, settings)
+        bot = BotClass(**init_kwargs)
+        ui_log(f"✅ Bot initialized with: {', '.join(init_kwargs) or 'defaults'}")
             
         progress_bar.progress(30)
         status_text.text("✅ Bot configured successfully")
         
     except Exception as e:
         st.error(f"❌ Could not instantiate bot: {e}")
+        flush_logs()
         st.session_state["processing"] = False
         st.stop()
 
@@ -226,21 +330,14 @@ if run_btn and uploaded_file:
         ui_log(message)
         
         # Extract progress information if available
-        if "post" in message.lower() and "/" in message:
-            try:
-                # Look for patterns like "Processing post 3/10" or "Completed 3/10 posts"
-                parts = message.split()
-                for part in parts:
-                    if "/" in part:
-                        current, total = part.split("/")
-                        current = int(current)
-                        total = int(total)
-                        progress = min(30 + int((current / total) * 60), 90)
-                        progress_bar.progress(progress)
-                        status_text.text(f"🔄 Processing: {current}/{total} posts")
-                        break
-            except:
-                pass
+        # Look for patterns like "Processing post 3/10" or "Completed 3/10 posts"
+        progress_match = _PROGRESS_RE.search(message) if "post" in message.lower() else None
+        if progress_match:
+            current, total = int(progress_match.group(1)), int(progress_match.group(2))
+            if total > 0:
+                progress = min(30 + int((current / total) * 60), 90)
+                progress_bar.progress(progress)
+                status_text.text(f"🔄 Processing: {current}/{total} posts")
         elif "login" in message.lower():
             progress_bar.progress(40)
             status_text.text("🔐 Waiting for login...")
@@ -257,21 +354,23 @@ if run_btn and uploaded_file:
         progress_bar.progress(40)
         status_text.text("🚀 Starting bot execution...")
         
-        # Try to call with UI support if available
-        try:
-            exit_code = bot.run(str(local_path), ui_mode=True, on_update=progress_callback)
-        except TypeError:
+        # Call with UI support if the bot's run() accepts it
+        run_kwargs = accepted_kwargs(run_sig, {"ui_mode": True, "on_update": progress_callback})
+        if "ui_mode" not in run_kwargs:
             # Fallback for older bot versions
             ui_log("⚠️ Bot.run() does not support ui_mode; using legacy run() method.")
-            exit_code = bot.run(str(local_path))
+            run_kwargs = {}
+        exit_code = bot.run(str(local_path), **run_kwargs)
             
     except Exception as e:
         st.error(f"❌ Bot execution failed: {e}")
         ui_log(f"❌ Fatal error during bot execution: {e}")
+        flush_logs()
         st.session_state["processing"] = False
         st.stop()
 
     # Process results with enhanced feedback
+    flush_logs()
     progress_bar.progress(100)
     
     if exit_code == 0:
@@ -300,30 +399,31 @@ if run_btn and uploaded_file:
 
     # Show processed file info
     try:
-        processed_files = list(Path.cwd().glob("processed_*.xlsx")) + list(Path.cwd().glob("processed_*.csv"))
-        if processed_files:
-            latest_file = max(processed_files, key=lambda x: x.stat().st_mtime)
+        # Failed runs (login timeout, fatal errors, empty sheet) don't write a processed file
+        latest_file = latest_processed_file() if exit_code in (0, 3) else None
+        if latest_file is not None:
             st.info(f"📄 **Processed file saved:** `{latest_file.name}`")
             
             # Show updated file preview
             with st.expander("📊 Updated File Preview", expanded=False):
                 try:
-                    if latest_file.suffix.lower() == ".csv":
-                        df_updated = pd.read_csv(latest_file)
-                    else:
-                        df_updated = pd.read_excel(latest_file)
+                    # Head rows + single-column counts, reused until the file changes
+                    summary_key = (str(latest_file), latest_file.stat().st_mtime)
+                    summary = st.session_state.get("last_result_summary")
+                    if summary is None or summary[0] != summary_key:
+                        ext = latest_file.suffix.lower().lstrip(".")
+                        summary = (summary_key, _load_preview(latest_file.read_bytes(), ext, nrows=5))
+                        st.session_state["last_result_summary"] = summary
+                    df_updated, _, total_rows, completed, status_col = summary[1]
                     
                     st.write(f"**Updated file:** {latest_file.name}")
-                    st.write(f"**Rows:** {len(df_updated)} | **Columns:** {len(df_updated.columns)}")
+                    st.write(f"**Rows:** {total_rows} | **Columns:** {len(df_updated.columns)}")
                     
                     # Show status column if exists
-                    status_cols = [col for col in df_updated.columns if any(x in str(col).lower() for x in ["status", "commented", "done", "posted"])]
-                    if status_cols:
-                        status_col = status_cols[0]
-                        completed = df_updated[status_col].astype(str).str.upper().str.strip().isin(["Y", "YES", "TRUE", "1"]).sum()
-                        st.write(f"**Completed comments:** {completed}/{len(df_updated)}")
+                    if status_col is not None:
+                        st.write(f"**Completed comments:** {completed}/{total_rows}")
                     
-                    st.dataframe(df_updated.head(), use_container_width=True)
+                    st.dataframe(df_updated, use_container_width=True)
                 except Exception as e:
                     st.error(f"Could not preview updated file: {e}")
     except Exception:
@@ -18,17 +18,31 @@ Python: >=3.10
 """
 
 import argparse
+import atexit
+import collections
+import copy
+import csv
+import importlib.util
+import itertools
 import logging
+import logging.handlers
+import numpy as np
 import os
 import pandas as pd
+import queue
 import random
+import re
+import shutil
+import signal
 import sys
 import tempfile
+import threading
 import time
+import weakref
 from datetime import datetime
-from io import BytesIO
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
-from typing import Any, List, Dict, Optional, Tuple, Callable
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Tuple, Callable
 
 import chromedriver_autoinstaller
 from selenium import webdriver
@@ -47,62 +61,425 @@ from selenium.common.exceptions import (
 )
 
 
+# Elements that only render for a logged-in session
+LOGIN_INDICATOR_SELECTOR = ", ".join([
+    "[data-testid='SideNav_AccountSwitcher_Button']",
+    "[data-testid='AppTabBar_Profile_Link']",
+    "[aria-label='Profile']",
+    "[data-testid='primaryColumn']",
+])
+
+# Signed-in URLs: the home timeline, or any x.com page outside the login flow
+_LOGGED_IN_URL_RE = re.compile(r"/home|x\.com(?!.*/login)")
+
+# post_comment element probes: short polled wait per probe, one longer wait as last resort
+PROBE_TIMEOUT = 3
+PROBE_FALLBACK_TIMEOUT = 10
+PROBE_POLL = 0.1
+
+# Posts loaded into one work tab before it is swapped for a fresh one; a long-lived X tab
+# keeps accumulating timeline caches and listeners. With preloading on (the serial default)
+# each adopted preload becomes the work tab, so this only bites for workers and --preload-tabs 0
+MAX_USES_PER_TAB = 50
+
+# post_comment element candidates, most specific first. _find_clickable checks them all in
+# priority order with one script per poll, so each step costs one wait however many it has
+REPLY_LOCATORS = (
+    (By.CSS_SELECTOR, "[data-testid='reply']"),
+    (By.CSS_SELECTOR, "[aria-label*='Reply']"),
+    (By.CSS_SELECTOR, "[data-testid='tweetButtonInline']"),
+    (By.CSS_SELECTOR, "button[aria-label*='Reply']"),
+)
+COMPOSE_LOCATORS = (
+    (By.CSS_SELECTOR, "[data-testid='tweetTextarea_0']"),
+    (By.CSS_SELECTOR, "[contenteditable='true'][role='textbox']"),
+    (By.CSS_SELECTOR, ".public-DraftEditor-content"),
+    (By.CSS_SELECTOR, "[aria-label*='Post your reply']"),
+    (By.CSS_SELECTOR, "[placeholder*='Post your reply']"),
+    (By.CSS_SELECTOR, "div[contenteditable='true']"),
+)
+POST_LOCATORS = (
+    (By.CSS_SELECTOR, "[data-testid='tweetButton']"),
+    (By.CSS_SELECTOR, "[data-testid='tweetButtonInline']"),
+    # Generic buttons are matched by their label, which CSS cannot express
+    (By.XPATH, "//button[not(@disabled) and (contains(., 'Reply') or contains(., 'Post'))]"),
+    # Label matches stay inside the reply dialog: the focal tweet's own Reply icon matches too
+    (By.CSS_SELECTOR, "div[role='dialog'] button[aria-label*='Reply']"),
+    (By.CSS_SELECTOR, "div[role='dialog'] button[aria-label*='Post']"),
+)
+
+# First visible, enabled element for [by, selector] pairs walked in priority order;
+# returns [element, index of the pair that matched] or null
+FIND_CLICKABLE_JS = """
+var locators = arguments[0];
+for (var i = 0; i < locators.length; i++) {
+    var els = [];
+    if (locators[i][0] === 'xpath') {
+        var snap = document.evaluate(locators[i][1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var j = 0; j < snap.snapshotLength; j++) { els.push(snap.snapshotItem(j)); }
+    } else {
+        els = document.querySelectorAll(locators[i][1]);
+    }
+    for (var k = 0; k < els.length; k++) {
+        var el = els[k];
+        var visible = el.offsetWidth > 0 || el.offsetHeight > 0 || el.getClientRects().length > 0;
+        if (visible && !el.disabled && el.getAttribute('aria-disabled') !== 'true') { return [el, i]; }
+    }
+}
+return null;
+"""
+
+# Empty the compose area through the editor's own input handling (element.clear() does nothing
+# on X's contenteditable composer); returns the length of any text left behind
+CLEAR_COMPOSE_JS = """
+var el = arguments[0];
+el.focus();
+if (typeof el.select === 'function') {
+    el.select();
+} else {
+    var range = document.createRange();
+    range.selectNodeContents(el);
+    var sel = window.getSelection();
+    sel.removeAllRanges();
+    sel.addRange(range);
+}
+document.execCommand('delete');
+return (el.innerText || el.value || '').trim().length;
+"""
+
+# Scroll an element into view and click it in a single execute_script
+SCROLL_CLICK_JS = "arguments[0].scrollIntoView({block:'center'}); arguments[0].click();"
+
+# Click the post button only if it exists and is enabled; returns 'ok', 'missing' or 'disabled'
+POST_CLICK_JS = """
+var btn = document.querySelector(arguments[0]);
+if (!btn) { return 'missing'; }
+if (btn.disabled || btn.getAttribute('aria-disabled') === 'true') { return 'disabled'; }
+btn.scrollIntoView({block: 'center'});
+btn.click();
+return 'ok';
+"""
+
+# Directory of this script, searched for sheets not found where named
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Chrome profile the CLI keeps between runs, so a logged-in X session skips the login wait
+DEFAULT_PROFILE_DIR = os.path.expanduser("~/.xcommenter_profile")
+
+# chromedriver binaries cached per Chrome version, reused on warm starts
+DRIVER_CACHE_DIR = Path.home() / ".xcommenter"
+
+# Chrome content settings that never matter for posting (2 = block)
+CHROME_CONTENT_PREFS = {
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.managed_default_content_settings.plugins": 2,
+    "profile.managed_default_content_settings.popups": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+}
+
+# Request patterns dropped once logged in: X serves images from pbs and video from video.twimg.com
+BLOCKED_MEDIA_URLS = (
+    "*pbs.twimg.com/*",
+    "*video.twimg.com/*",
+    "*.mp4*",
+    "*.m3u8*",
+    "*.m4s*",
+)
+
+# Columns of the per-run results CSV, in the order results are built
+RESULT_FIELDS = ("post_number", "original_index", "url", "comment", "status", "message", "timestamp")
+
+# Failures that may clear up on a second attempt; anything else ends the retry loop
+RETRYABLE_ERRORS = (TimeoutException, StaleElementReferenceException)
+
+# Attempts per post: one on the first pass so a flaky post never holds up the queue, then
+# retryable failures get a second pass (with backoff between attempts) after everything else
+FIRST_PASS_ATTEMPTS = 1
+RETRY_PASS_ATTEMPTS = 2
+
+# A post page is ready once its reply button renders, or it has settled on an error/login page
+PAGE_READY = EC.any_of(
+    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='reply'], [data-testid='error-detail']")),
+    EC.url_contains("/i/flow/login"),
+)
+
+# Detect pages that no retry will fix: logged out, or X's "post unavailable" error view
+PAGE_PROBLEM_JS = """
+if (window.location.href.indexOf('/i/flow/login') !== -1) { return 'Logged out (redirected to login)'; }
+if (document.querySelector("[data-testid='error-detail']")) { return 'Post unavailable'; }
+return null;
+"""
+
+# Login confirmation panel, parsed once per injection via insertAdjacentHTML
+OVERLAY_HTML = (
+    '<div id="xbot-login-overlay" style="position:fixed;right:20px;bottom:20px;z-index:999999;'
+    'background:rgba(20,20,20,0.92);color:#fff;padding:16px;border-radius:16px;'
+    'box-shadow:0 8px 24px rgba(0,0,0,0.35);max-width:320px;'
+    'font-family:system-ui,-apple-system,Segoe UI,Roboto,sans-serif">'
+    '<div style="font-size:16px;font-weight:600;margin-bottom:8px">X Comment Bot</div>'
+    '<div style="font-size:13px;opacity:0.9;margin-bottom:12px">'
+    'Log in to X in this window, then click the button below to continue.</div>'
+    '<div style="display:flex;gap:8px">'
+    '<button id="xbot-login-btn" style="flex:1;padding:10px 12px;border-radius:12px;border:none;'
+    'cursor:pointer;font-weight:600;font-size:14px">I&#39;m logged in</button>'
+    '<button id="xbot-login-hide" style="padding:10px 12px;border-radius:12px;'
+    'border:1px solid rgba(255,255,255,0.25);cursor:pointer;background:transparent;color:#fff">Hide</button>'
+    '</div></div>'
+)
+
+# Installs the overlay once per document. A MutationObserver puts it back if the page
+# re-renders it away; only the panel's own buttons dismiss it.
+_OVERLAY_INSTALL_FN = """
+function (html) {
+  if (window.__xbotOverlayDismissed || document.getElementById('xbot-login-overlay')) { return; }
+  document.documentElement.insertAdjacentHTML('beforeend', html);
+  var overlay = document.getElementById('xbot-login-overlay');
+  var close = function () {
+    window.__xbotOverlayDismissed = true;
+    overlay.remove();
+  };
+  document.getElementById('xbot-login-btn').addEventListener('click', function () {
+    try { window.localStorage.setItem('xbot_login_ok', '1'); } catch (e) {}
+    close();
+  }, { once: true });
+  document.getElementById('xbot-login-hide').addEventListener('click', close, { once: true });
+  if (!window.__xbotOverlayObserver) {
+    window.__xbotOverlayObserver = new MutationObserver(function () {
+      var current = document.getElementById('xbot-login-overlay');
+      if (!window.__xbotOverlayDismissed && !current) { document.documentElement.appendChild(overlay); }
+    });
+    window.__xbotOverlayObserver.observe(document.documentElement, { childList: true });
+  }
+}
+"""
+
+# One poll of the login wait: re-installs the overlay after a full navigation and reports
+# the button flag (kept in localStorage so it survives redirects) and login indicators
+LOGIN_PROBE_JS = "(" + _OVERLAY_INSTALL_FN + """)(arguments[1]);
+var flag = null;
+try { flag = window.localStorage.getItem('xbot_login_ok'); } catch (e) {}
+return {
+  url: window.location.href,
+  flag: flag,
+  loggedIn: !!document.querySelector(arguments[0])
+};
+"""
+
+# Normalized header names recognised for each column role
+URL_HEADERS = frozenset({"url", "posturl", "tweet_url", "link", "post_link"})
+AUTHOR_HEADERS = frozenset({"author", "authorname", "user", "username"})
+STATUS_HEADERS = frozenset({"commented_(y/n)", "commented", "done", "posted", "status"})
+_NORM_TRANS = str.maketrans({"-": "_"})
+_NL_RE = re.compile(r"[\r\n]+")
+# Status cell values (stripped, upper-cased) that mark a row as already commented
+DONE_STATUSES = frozenset({"Y", "YES", "TRUE", "1"})
+
+# Longest a status update may wait in memory before the batch is written out anyway (seconds)
+FLUSH_INTERVAL = 30.0
+
+# log_and_callback level names; "debug" goes to the log file only
+_LOG_LEVELS = {"debug": logging.DEBUG, "info": logging.INFO, "warning": logging.WARNING, "error": logging.ERROR}
+
+# Rows per chunk when streaming a sheet; only rows still to be commented are kept between chunks
+CHUNK_ROWS = 50_000
+
+# Rust-based calamine parses xlsx several times faster than openpyxl; probed once at import
+_HAS_CALAMINE = importlib.util.find_spec("python_calamine") is not None
+EXCEL_READ_ENGINES = (("calamine",) if _HAS_CALAMINE else ()) + ("openpyxl", None)
+
+# pyarrow's multithreaded CSV reader streams record batches much faster than pandas' C parser
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+# pandas' default NA markers, so both CSV readers leave the same cells empty
+CSV_NULL_VALUES = ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+                   "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"]
+
+# Excel writers tried in order when write_backend="auto"; pyexcelerate and xlsxwriter are optional
+EXCEL_WRITE_BACKENDS = ("pyexcelerate", "xlsxwriter", "openpyxl")
+
+
+def _pandas_header_names(header: Iterable[Any]) -> List[str]:
+    """Column names pandas would give a header row: blanks become "Unnamed: i", duplicates get ".n"."""
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for i, value in enumerate(header):
+        name = f"Unnamed: {i}" if value is None else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+# Bots with status writes that may still be buffered; flushed if the interpreter exits early
+_LIVE_BOTS: "weakref.WeakSet[XCommentBot]" = weakref.WeakSet()
+
+# Log records pending for the writer thread; the oldest are dropped rather than block a post
+LOG_QUEUE_SIZE = 10000
+_LOG_LISTENER: Optional["_DropOldestQueueListener"] = None
+
+
+def _put_dropping_oldest(q: queue.Queue, item: Any):
+    """Put item without blocking, evicting the oldest pending entries while q is full."""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the log writer thread without ever blocking the caller."""
+
+    def enqueue(self, record: logging.LogRecord):
+        _put_dropping_oldest(self.queue, record)
+
+
+class _DropOldestQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() still gets its sentinel in when the queue is full."""
+
+    def enqueue_sentinel(self):
+        _put_dropping_oldest(self.queue, self._sentinel)
+
+
+# Registered before _flush_live_bots so it runs after it: the final status writes still get logged
+@atexit.register
+def _stop_log_listener():
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+
+
+@atexit.register
+def _flush_live_bots():
+    for bot in list(_LIVE_BOTS):
+        bot._flush_excel()
+
+
+class PostPacer:
+    """
+    Spaces out post starts by delay + jitter, measured start to start, so time spent
+    loading and posting counts towards the gap. Shared by the serial loop and by worker
+    threads, which then keep the same account-level pacing between them.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self, announce: Optional[Callable[[float], None]] = None):
+        """Block until the next start slot, passing the pause length to announce first."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at)
+            self._next_at = start + self.interval + random.uniform(0.5, 1.5)
+        if start > now:
+            if announce:
+                announce(start - now)
+            time.sleep(start - now)
+
+
 class XCommentBot:
     """
     Automates X (Twitter) commenting with adaptive spreadsheet parsing and a no-terminal login flow.
     """
 
-    def __init__(self, delay: float = 2.0, profile_path: str | None = None, headless: bool = False):
+    def __init__(self, delay: float = 2.0, profile_path: str | None = None, headless: bool = False,
+                 flush_every: int = 25, write_backend: str = "auto", workers: int = 1,
+                 block_media: bool = True, preload_tabs: int = 1, remote_url: Optional[str] = None):
         self.delay = delay
         self.profile_path = profile_path
         self.headless = headless
+        self.flush_every = max(1, flush_every)
+        self.write_backend = write_backend
+        self.workers = max(1, workers)
+        self.block_media = block_media
+        self.preload_tabs = max(0, preload_tabs)
+        self.remote_url = remote_url  # Already-running chromedriver to attach to instead of spawning one
         self.driver = None
         self.wait = None
         self.main_window = None
+        self.work_window = None
+        self._work_tab_uses = 0  # Posts loaded in work_window so far
+        self._work_tab_focused = False  # Driver is known to be on work_window; no switch needed
+        # (url, window handle) of upcoming posts already loading in background tabs
+        self._prefetched: "collections.deque[Tuple[str, str]]" = collections.deque()
         self.results: List[Dict] = []
+        self._success_count: int = 0  # Successes in self.results, kept by _record_result
         self.original_df: Optional[pd.DataFrame] = None
+        self._writeback_source: Any = None
+        self._writeback_csv_encoding: Optional[str] = None  # Set when _writeback_source is a CSV
+        # CSV inputs: statuses by data row, merged into a streamed copy of the source on flush
+        self._csv_statuses: Dict[int, str] = {}
+        # Excel inputs: the source workbook, edited in place one status cell at a time
+        self._wb = None
+        self._ws = None
+        self._status_col_idx: Optional[int] = None
         self.sheet_path: Optional[str] = None
         self._status_col_name: Optional[str] = None
+        self._dirty_rows: int = 0
+        self._dirty_since: float = 0.0  # time.monotonic() of the oldest unsaved status
+        # Winning locator per post_comment step, reused for the rest of the session
+        self._sel_cache: Dict[str, Optional[Tuple[str, str]]] = {"reply": None, "compose": None, "post": None}
         self._source_desc: str = ""
         self.ui_callback: Optional[Callable] = None
+        self._results_file: Optional[str] = None
+        self._results_fp = None
+        self._results_writer: Optional[csv.DictWriter] = None
         self.setup_logging()
 
     def setup_logging(self):
+        global _LOG_LISTENER
+        self.logger = logging.getLogger(__name__)
+        if _LOG_LISTENER is not None or logging.getLogger().handlers:
+            return  # Logging is process-wide; the first bot (or the host app) configured it
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"x_commenter_{timestamp}.log"
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler(log_file, mode="w")
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        # Parallel workers interleave their lines, so tag each with the thread that wrote it.
+        # Always on: this format outlives the bot that set it (the Streamlit app reuses the process)
+        formatter = logging.Formatter("%(asctime)s - %(threadName)s - %(levelname)s - %(message)s")
+        console = logging.StreamHandler(sys.stdout)
+        # Opened on the first flush; utf-8 so the ✓/✗ marks encode under any locale
+        file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8", delay=True)
+        for handler in (console, file_handler):
+            handler.setFormatter(formatter)
+        # File writes are batched; errors (and interpreter exit) flush the buffer
+        buffered_file = logging.handlers.MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=file_handler)
+        # Console and file I/O happen on the listener's thread, off the posting path
+        log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        _LOG_LISTENER = _DropOldestQueueListener(log_queue, console, buffered_file)
+        _LOG_LISTENER.start()
+        queue_handler = _DropOldestQueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))  # The listener's handlers add the prefix
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
         self.logger.info(f"X Commenter Bot initialized. Log file: {log_file}")
 
-    def log_and_callback(self, message: str, level: str = "info"):
-        """Log message and call UI callback if available"""
-        if level == "info":
-            self.logger.info(message)
-        elif level == "warning":
-            self.logger.warning(message)
-        elif level == "error":
-            self.logger.error(message)
+    def log_and_callback(self, message: str, level: str = "info", *args: Any):
+        """
+        Log message and call UI callback if available. With args, message is a %-format
+        string that is only rendered when a handler or the UI actually uses it.
+        """
+        if level == "debug":
+            self.logger.debug(message, *args)  # Diagnostic detail: not shown in the UI
+            return
+        if level in _LOG_LEVELS:
+            self.logger.log(_LOG_LEVELS[level], message, *args)
         
         if self.ui_callback:
             try:
-                self.ui_callback(message)
+                self.ui_callback(message % args if args else message)
             except Exception:
                 pass  # Don't let UI callback errors break the main flow
 
-    def setup_chrome_driver(self) -> webdriver.Chrome:
+    def setup_chrome_driver(self) -> webdriver.Remote:
         self.log_and_callback("Setting up Chrome WebDriver...")
-        driver_path = chromedriver_autoinstaller.install()
-        self.log_and_callback(f"ChromeDriver installed at: {driver_path}")
-        
         chrome_options = Options()
         if self.headless:
             chrome_options.add_argument("--headless=new")
@@ -114,10 +491,14 @@ class XCommentBot:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
+        chrome_options.add_experimental_option("prefs", CHROME_CONTENT_PREFS)
+        # driver.get returns at DOMContentLoaded; every page step then waits for the element it needs
+        chrome_options.page_load_strategy = "eager"
         
         if self.profile_path:
             chrome_options.add_argument(f"--user-data-dir={self.profile_path}")
-        else:
+            self.log_and_callback(f"Using Chrome profile directory: {self.profile_path}")
+        elif not self.remote_url:
             temp_dir = tempfile.mkdtemp()
             chrome_options.add_argument(f"--user-data-dir={temp_dir}")
             self.log_and_callback(f"Using temporary profile directory: {temp_dir}")
@@ -126,13 +507,69 @@ class XCommentBot:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         
-        service = Service(driver_path)
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        if self.remote_url:
+            # The chromedriver keeps running between bots; only the browser session is new
+            self.log_and_callback(f"Attaching to ChromeDriver at {self.remote_url}")
+            self.driver = webdriver.Remote(command_executor=self.remote_url, options=chrome_options)
+        else:
+            driver_path = self._chromedriver_path()
+            self.log_and_callback(f"ChromeDriver installed at: {driver_path}")
+            self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         self.wait = WebDriverWait(self.driver, 20)
         self.log_and_callback("Chrome WebDriver setup completed successfully")
         return self.driver
 
+    def block_heavy_media(self):
+        """
+        Stop the browser fetching images and video. Applied only after login so the
+        login page (and any challenge images) render normally.
+        """
+        if not self.block_media:
+            return
+        try:
+            self._cdp("Network.enable", {})
+            self._cdp("Network.setBlockedURLs", {"urls": list(BLOCKED_MEDIA_URLS)})
+            self.log_and_callback("Image and video loading disabled for posting")
+        except WebDriverException as e:
+            self.log_and_callback(f"Could not block media requests: {e}", "warning")
+
+    def _cdp(self, cmd: str, params: Dict) -> Any:
+        """Run a DevTools command; unlike execute_cdp_cmd this also works on a Remote session."""
+        return self.driver.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+
+    def _chromedriver_path(self) -> str:
+        """
+        Return a chromedriver matching the installed Chrome. A copy cached per Chrome version
+        is used when present, skipping chromedriver_autoinstaller's network version check.
+        ChromeDriver only has to match Chrome's major version, so after a minor Chrome
+        update the newest cached driver of the same major is reused as well.
+        """
+        try:
+            version = chromedriver_autoinstaller.get_chrome_version()
+        except Exception:
+            version = None
+        cached = None
+        if version:
+            suffix = ".exe" if sys.platform.startswith("win") else ""
+            cached = DRIVER_CACHE_DIR / f"chromedriver-{version}{suffix}"
+            if cached.is_file() and os.access(cached, os.X_OK):
+                return str(cached)
+            major = version.split(".")[0]
+            same_major = [p for p in DRIVER_CACHE_DIR.glob(f"chromedriver-{major}.*{suffix}")
+                          if p.is_file() and os.access(p, os.X_OK)]
+            if same_major:
+                return str(max(same_major, key=lambda p: p.stat().st_mtime))
+
+        driver_path = chromedriver_autoinstaller.install()
+        if cached is not None and driver_path:
+            try:
+                DRIVER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(driver_path, cached)
+            except OSError as e:
+                self.log_and_callback(f"Could not cache ChromeDriver: {e}", "warning")
+        return driver_path
+
     def navigate_to_login(self):
         self.log_and_callback("Navigating to X login page...")
         self.driver.get("https://x.com/i/flow/login")
@@ -154,65 +591,40 @@ class XCommentBot:
             self.log_and_callback("2) Click the floating 'I'm logged in' button to continue.")
             self.log_and_callback("=" * 60)
 
-            self._inject_overlay_panel()
-
-            start = time.time()
+            # The first probe installs the overlay, so no separate injection call is needed
             timeout_seconds = 15 * 60
-            last_log = 0
-            last_url = ""
-
-            while True:
-                try:
-                    present = self.driver.execute_script("return !!document.getElementById('xbot-login-overlay');")
-                except Exception:
-                    present = True
-
-                try:
-                    current_url = self.driver.current_url
-                except Exception:
-                    current_url = last_url
-
-                if (not present) or (current_url != last_url):
-                    try:
-                        self._inject_overlay_panel()
-                    except Exception:
-                        pass
-                    last_url = current_url
-
-                try:
-                    flag = self.driver.execute_script("return window.localStorage.getItem('xbot_login_ok');")
-                except Exception:
-                    flag = None
-
-                if flag == "1":
-                    self.log_and_callback("Login confirmed via UI button.")
-                    try:
-                        self.driver.execute_script("window.localStorage.removeItem('xbot_login_ok');")
-                    except Exception:
-                        pass
-                    try:
-                        self.driver.execute_script("var el = document.getElementById('xbot-login-overlay'); if (el) { el.remove(); }")
-                    except Exception:
-                        pass
-                    break
-
-                if self.confirm_login():
-                    self.log_and_callback("Login auto-confirmed via page indicators.")
-                    try:
-                        self.driver.execute_script("var el = document.getElementById('xbot-login-overlay'); if (el) { el.remove(); }")
-                    except Exception:
-                        pass
-                    break
-
-                if time.time() - start > timeout_seconds:
-                    self.log_and_callback("Login wait timed out after 15 minutes.", "error")
-                    raise TimeoutException("Login not confirmed within timeout.")
-
-                if time.time() - last_log > 10:
+            last_log = [time.time()]
+
+            def login_state(driver):
+                # Single round trip per poll; overlay upkeep happens inside the page
+                state = driver.execute_script(LOGIN_PROBE_JS, LOGIN_INDICATOR_SELECTOR, OVERLAY_HTML) or {}
+                if state.get("flag") == "1" or state.get("loggedIn") or self._url_looks_logged_in(state.get("url") or ""):
+                    return state
+                if time.time() - last_log[0] > 10:
                     self.log_and_callback("Waiting for login confirmation... (click the overlay button when ready)")
-                    last_log = time.time()
+                    last_log[0] = time.time()
+                return False
 
-                time.sleep(1.0)
+            try:
+                state = WebDriverWait(
+                    self.driver, timeout_seconds, poll_frequency=0.25, ignored_exceptions=(WebDriverException,)
+                ).until(login_state)
+            except TimeoutException:
+                self.log_and_callback("Login wait timed out after 15 minutes.", "error")
+                raise
+
+            if state.get("flag") == "1":
+                self.log_and_callback("Login confirmed via UI button.")
+            else:
+                self.log_and_callback("Login auto-confirmed via page indicators.")
+            try:
+                self.driver.execute_script(
+                    "window.__xbotOverlayDismissed = true;"
+                    "window.localStorage.removeItem('xbot_login_ok');"
+                    "var el = document.getElementById('xbot-login-overlay'); if (el) { el.remove(); }"
+                )
+            except Exception:
+                pass
 
             return True
 
@@ -220,106 +632,25 @@ class XCommentBot:
             self.log_and_callback(f"Error during UI login wait: {str(e)}", "error")
             return False
 
-    def _inject_overlay_panel(self):
-        try:
-            self.driver.execute_script(
-                """
-                (function(){
-                  if (document.getElementById('xbot-login-overlay')) { return; }
-                  var wrap = document.createElement('div');
-                  wrap.id = 'xbot-login-overlay';
-                  wrap.style.position = 'fixed';
-                  wrap.style.right = '20px';
-                  wrap.style.bottom = '20px';
-                  wrap.style.zIndex = '999999';
-                  wrap.style.background = 'rgba(20,20,20,0.92)';
-                  wrap.style.color = '#fff';
-                  wrap.style.padding = '16px';
-                  wrap.style.borderRadius = '16px';
-                  wrap.style.boxShadow = '0 8px 24px rgba(0,0,0,0.35)';
-                  wrap.style.maxWidth = '320px';
-                  wrap.style.fontFamily = 'system-ui, -apple-system, Segoe UI, Roboto, sans-serif';
-
-                  var title = document.createElement('div');
-                  title.textContent = 'X Comment Bot';
-                  title.style.fontSize = '16px';
-                  title.style.fontWeight = '600';
-                  title.style.marginBottom = '8px';
-
-                  var msg = document.createElement('div');
-                  msg.textContent = 'Log in to X in this window, then click the button below to continue.';
-                  msg.style.fontSize = '13px';
-                  msg.style.opacity = '0.9';
-                  msg.style.marginBottom = '12px';
-
-                  var bar = document.createElement('div');
-                  bar.style.display = 'flex';
-                  bar.style.gap = '8px';
-
-                  var btn = document.createElement('button');
-                  btn.textContent = "I'm logged in";
-                  btn.style.flex = '1';
-                  btn.style.padding = '10px 12px';
-                  btn.style.borderRadius = '12px';
-                  btn.style.border = 'none';
-                  btn.style.cursor = 'pointer';
-                  btn.style.fontWeight = '600';
-                  btn.style.fontSize = '14px';
-
-                  btn.addEventListener('click', function(){
-                    try { window.localStorage.setItem('xbot_login_ok', '1'); } catch(e){}
-                    var el = document.getElementById('xbot-login-overlay');
-                    if (el) { el.remove(); }
-                  }, { once: true });
-
-                  var cancel = document.createElement('button');
-                  cancel.textContent = 'Hide';
-                  cancel.style.padding = '10px 12px';
-                  cancel.style.borderRadius = '12px';
-                  cancel.style.border = '1px solid rgba(255,255,255,0.25)';
-                  cancel.style.cursor = 'pointer';
-                  cancel.style.background = 'transparent';
-                  cancel.style.color = '#fff';
-
-                  cancel.addEventListener('click', function(){
-                    var el = document.getElementById('xbot-login-overlay');
-                    if (el) { el.remove(); }
-                  }, { once: true });
-
-                  bar.appendChild(btn);
-                  bar.appendChild(cancel);
-                  wrap.appendChild(title);
-                  wrap.appendChild(msg);
-                  wrap.appendChild(bar);
-                  document.documentElement.appendChild(wrap);
-                })();
-                """
-            )
-            self.log_and_callback("Injected login confirmation overlay into the page.")
-        except Exception as e:
-            self.log_and_callback(f"Could not inject overlay panel: {e}", "warning")
+    @staticmethod
+    def _url_looks_logged_in(url: str) -> bool:
+        return _LOGGED_IN_URL_RE.search(url) is not None
 
     def confirm_login(self) -> bool:
         try:
-            login_indicators = [
-                (By.CSS_SELECTOR, "[data-testid='SideNav_AccountSwitcher_Button']"),
-                (By.CSS_SELECTOR, "[data-testid='AppTabBar_Profile_Link']"),
-                (By.CSS_SELECTOR, "[aria-label='Profile']"),
-                (By.CSS_SELECTOR, "[data-testid='primaryColumn']")
-            ]
-            for selector_type, selector in login_indicators:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((selector_type, selector))
-                    )
-                    if element is not None:
-                        self.log_and_callback(f"Login confirmed via element: {selector}")
-                        return True
-                except TimeoutException:
-                    continue
+            # One findElements call covers every indicator
+            try:
+                element = WebDriverWait(self.driver, 2, poll_frequency=PROBE_POLL).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, LOGIN_INDICATOR_SELECTOR))
+                )
+                if element is not None:
+                    self.log_and_callback("Login confirmed via page element")
+                    return True
+            except TimeoutException:
+                pass
             
             current_url = self.driver.current_url
-            if ("/home" in current_url) or (("x.com" in current_url) and ("/login" not in current_url)):
+            if self._url_looks_logged_in(current_url):
                 self.log_and_callback(f"Login confirmed via URL pattern: {current_url}")
                 return True
             return False
@@ -332,33 +663,35 @@ class XCommentBot:
         """Normalize column names for comparison"""
         if col is None:
             return ""
-        return (
-            str(col)
-            .strip()
-            .lower()
-            .replace("  ", " ")
-            .replace(" ", "_")
-            .replace("-", "_")
-        )
+        # split() collapses whitespace runs, so "Generated  comment" -> "generated_comment"
+        return "_".join(str(col).strip().lower().split()).translate(_NORM_TRANS)
 
-    def _detect_column(self, norm_cols: List[str], raw_cols: List[str], want: str) -> Optional[str]:
-        """Detect column by type with improved matching"""
-        candidates = []
-        for norm, raw in zip(norm_cols, raw_cols):
-            if want == "url":
-                if norm in ("url", "posturl", "tweet_url", "link", "post_link"):
-                    candidates.append(raw)
-                elif ("url" in norm) and (("post" in norm) or ("tweet" in norm) or (norm == "url")):
-                    candidates.append(raw)
-            elif want == "comment":
-                if norm in ("generated_comment", "comment", "reply", "comment_text", "generatedcomment"):
-                    candidates.append(raw)
-                elif ("comment" in norm) or ("reply" in norm) or ("generated" in norm and "comment" in norm):
-                    candidates.append(raw)
-        
-        if len(candidates) > 0:
-            return candidates[0]
-        return None
+    def _normalized_headers(self, raw_cols: Iterable[Any]) -> Dict[str, str]:
+        """Normalize each header once; the first raw name wins when two normalize alike."""
+        norm_to_raw: Dict[str, str] = {}
+        for raw in raw_cols:
+            norm_to_raw.setdefault(self._normalize(raw), raw)
+        return norm_to_raw
+
+    @staticmethod
+    def _classify_headers(norm_to_raw: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """
+        Map normalized headers to the url/comment/author/status roles the bot uses in one pass.
+        The first column (left to right) that fits a role wins it.
+        """
+        roles: Dict[str, Optional[str]] = {"url": None, "comment": None, "author": None, "status": None}
+        for norm, raw in norm_to_raw.items():
+            if roles["url"] is None and (
+                norm in URL_HEADERS or ("url" in norm and ("post" in norm or "tweet" in norm))
+            ):
+                roles["url"] = raw
+            if roles["comment"] is None and ("comment" in norm or "reply" in norm):
+                roles["comment"] = raw
+            if roles["author"] is None and norm in AUTHOR_HEADERS:
+                roles["author"] = raw
+            if roles["status"] is None and norm in STATUS_HEADERS:
+                roles["status"] = raw
+        return roles
 
     def _resolve_sheet_path(self, sheet_path: str) -> Path:
         """Improved path resolution with better error handling"""
@@ -369,41 +702,282 @@ class XCommentBot:
             if sp.startswith(bad_prefix):
                 sp = sp[len(bad_prefix):]
         
-        p = Path(sp).expanduser().resolve()
-        
-        # If path is not absolute, make it relative to current working directory
-        if not p.is_absolute():
-            p = Path.cwd().resolve() / p
+        # Relative paths are taken from the current working directory; abspath does no disk access
+        p = Path(os.path.abspath(Path(sp).expanduser()))
         
         # Check if file exists
         if p.exists():
-            return p
+            return p.resolve()
         
         # Try to find file in script directory
-        try:
-            script_dir = Path(__file__).parent.resolve()
-            alt = script_dir / p.name
-            if alt.exists():
-                return alt
-        except Exception:
-            pass
+        alt = SCRIPT_DIR / p.name
+        if alt.exists():
+            return alt
         
-        # Try case-insensitive search in current directory
+        # Try case-insensitive search in current directory, stopping at the first match
+        target = p.name.lower()
         try:
-            cwd = Path.cwd().resolve()
-            for candidate in cwd.glob("*"):
-                if candidate.name.lower() == p.name.lower():
-                    return candidate
-        except Exception:
+            with os.scandir(Path.cwd()) as entries:
+                for entry in entries:
+                    if entry.name.lower() == target:
+                        return Path(entry.path)
+        except OSError:
             pass
         
         return p
 
+    def _is_bot_column(self, name: Any) -> bool:
+        """True for headers that could fill one of the bot's roles or hold the post text."""
+        raw = str(name).strip()
+        return raw in ("PostText", "content") or any(self._classify_headers({self._normalize(raw): raw}).values())
+
+    def _iter_excel_columns(self, src: Any) -> Iterator[pd.DataFrame]:
+        """
+        Yield the columns the bot uses from the first sheet: in one frame via calamine when
+        it is installed, otherwise streamed with openpyxl in read-only mode in CHUNK_ROWS
+        batches. Row indices match pd.read_excel so they line up for write-back.
+        """
+        if _HAS_CALAMINE:
+            try:
+                df = pd.read_excel(src, engine="calamine", usecols=self._is_bot_column, dtype=str)
+            except Exception as e:
+                self.log_and_callback(f"calamine read failed, streaming with openpyxl: {e}", "warning")
+                if hasattr(src, "seek"):
+                    src.seek(0)
+            else:
+                yield df
+                return
+
+        from openpyxl import load_workbook
+
+        wb = load_workbook(src, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = next(rows, ())
+
+            names = _pandas_header_names(header)
+            keep = [i for i, n in enumerate(names) if self._is_bot_column(n)]
+            kept_names = [names[i] for i in keep]
+
+            def frame(index: List[int], columns: List[List[Any]]) -> pd.DataFrame:
+                return pd.DataFrame(dict(zip(kept_names, columns)), index=index, columns=kept_names)
+
+            index: List[int] = []
+            columns: List[List[Any]] = [[] for _ in keep]
+            for pos, row in enumerate(rows):
+                # Blank rows (read-only sheets report formatted-but-empty ones) are never processed
+                if all(v is None for v in row):
+                    continue
+                index.append(pos)
+                for values, i in zip(columns, keep):
+                    values.append(row[i] if i < len(row) else None)
+                if len(index) >= CHUNK_ROWS:
+                    yield frame(index, columns)
+                    index, columns = [], [[] for _ in keep]
+            yield frame(index, columns)
+        finally:
+            wb.close()
+
+    def _iter_csv_columns(self, src: Any, encoding: str) -> Iterator[pd.DataFrame]:
+        """
+        Yield the columns the bot uses from a CSV in chunks, as strings. pyarrow streams the
+        file when it is installed, otherwise pandas reads it in CHUNK_ROWS chunks; either way
+        column names and row indices match pd.read_csv so they line up for write-back.
+        """
+        if _HAS_PYARROW:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+
+            read_opts = dict(encoding=encoding, use_threads=True)
+            parse_opts = pacsv.ParseOptions(newlines_in_values=True)
+            try:
+                with pacsv.open_csv(src, read_options=pacsv.ReadOptions(**read_opts),
+                                    parse_options=parse_opts) as probe:
+                    names = _pandas_header_names(probe.schema.names)
+                if hasattr(src, "seek"):
+                    src.seek(0)
+                kept = [n for n in names if self._is_bot_column(n)]
+                reader = pacsv.open_csv(
+                    src,
+                    # Pass pandas' names so blank and duplicate headers resolve the same way
+                    read_options=pacsv.ReadOptions(column_names=names, skip_rows=1, **read_opts),
+                    parse_options=parse_opts,
+                    convert_options=pacsv.ConvertOptions(
+                        include_columns=kept, column_types={n: pa.string() for n in kept},
+                        null_values=CSV_NULL_VALUES, strings_can_be_null=True,
+                    ),
+                )
+            except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+                # Cannot be opened here (bad bytes for this encoding, ragged header...): let pandas try
+                self.log_and_callback("pyarrow CSV read failed, using pandas: %s", "debug", e)
+                if hasattr(src, "seek"):
+                    src.seek(0)
+            else:
+                with reader:
+                    start = 0
+                    for batch in reader:
+                        chunk = batch.to_pandas()
+                        chunk.index = pd.RangeIndex(start, start + len(chunk))
+                        start += len(chunk)
+                        yield chunk
+                    if not start:
+                        yield pd.DataFrame(columns=kept, dtype=str)  # Header-only file
+                return
+
+        yield from pd.read_csv(src, encoding=encoding, usecols=self._is_bot_column, dtype=str, chunksize=CHUNK_ROWS)
+
+    def _filter_full_read(self, df: Optional[pd.DataFrame]) -> Tuple[Optional[pd.DataFrame], Dict[str, Any]]:
+        """Filter a whole-sheet fallback read, keeping the unfiltered sheet for write-back."""
+        if df is None:
+            return None, {}
+        # Filtering only builds new frames, so the write-back copy can share the cell data
+        self.original_df = df.copy(deep=False)
+        return self._filter_chunks([df])
+
+    def _filter_chunks(self, chunks: Iterable[pd.DataFrame]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Clean each chunk as it is read and keep only the rows that still need a comment, so
+        peak memory is one chunk plus the survivors. Columns are classified on the first chunk.
+        Returns the surviving rows and a summary (roles, status column, row counts).
+        """
+        info: Dict[str, Any] = {"roles": None, "status_col": None, "has_status": False,
+                                "rows": 0, "valid": 0, "already": 0}
+        survivors: List[pd.DataFrame] = []
+        drop: List[str] = []
+        for chunk in chunks:
+            chunk.columns = [str(col).strip() for col in chunk.columns]  # Remove trailing spaces
+            if info["roles"] is None:
+                # Empty unnamed columns are noise; classify what is left
+                drop = [c for c in chunk.columns if c.startswith("Unnamed") and chunk[c].isna().all()]
+                raw_cols = [c for c in chunk.columns if c not in drop]
+                self.log_and_callback(f"Loaded columns: {raw_cols}")
+                norm_to_raw = self._normalized_headers(raw_cols)
+                self.log_and_callback(f"Normalized headers: {list(norm_to_raw)}")
+                info["roles"] = roles = self._classify_headers(norm_to_raw)
+                if roles["url"] is None or roles["comment"] is None:
+                    return pd.DataFrame(), info
+                info["status_col"] = roles["status"] or "Commented (Y/N)"
+                info["has_status"] = info["status_col"] in raw_cols
+            if drop:
+                chunk = chunk.drop(columns=drop)
+            if len(chunk):
+                info["rows"] = max(info["rows"], int(chunk.index[-1]) + 1)
+
+            # Standardize the URL/comment text once and derive every filter from it
+            # NA-aware "string" dtype: missing cells stay <NA> instead of becoming "nan" text
+            url = chunk[roles["url"]].astype("string").str.strip()
+            comment = (
+                chunk[roles["comment"]]
+                .astype("string")
+                .str.replace(_NL_RE, " ", regex=True)
+                .str.strip()
+            )
+            checks = (
+                url.str.len().gt(0), comment.str.len().gt(0),
+                url.str.lower().ne("nan"), comment.str.lower().ne("nan"),
+            )
+            # Nullable results are combined as plain bool arrays with <NA> counting as invalid
+            valid = pd.Series(
+                np.logical_and.reduce([c.to_numpy(dtype=bool, na_value=False) for c in checks]),
+                index=chunk.index,
+            )
+
+            # Already commented rows; each distinct status is tested once, rows match by category code
+            already = pd.Series(False, index=chunk.index)
+            if info["has_status"]:
+                status = chunk[info["status_col"]].astype("category")
+                done = [c for c in status.cat.categories if str(c).upper().strip() in DONE_STATUSES]
+                already = status.isin(done) & valid
+
+            info["valid"] += int(valid.sum())
+            info["already"] += int(already.sum())
+
+            # One boolean mask, one copy
+            keep = valid & ~already
+            survivors.append(chunk.loc[keep].assign(URL=url[keep], generated_comment=comment[keep]))
+
+        if info["roles"] is None:
+            raise ValueError("Spreadsheet has no header row")
+        df = pd.concat(survivors) if len(survivors) > 1 else survivors[0]
+        return df, info
+
+    def _read_excel_any(self, src: Any, read_errors: List[str], label: str) -> Optional[pd.DataFrame]:
+        """Full-sheet read trying each engine in EXCEL_READ_ENGINES on the same source."""
+        for engine in EXCEL_READ_ENGINES:
+            try:
+                if hasattr(src, "seek"):
+                    src.seek(0)
+                df = pd.read_excel(src, engine=engine)
+                self.log_and_callback(f"Successfully read {label} with {engine or 'auto'} engine")
+                return df
+            except Exception as e:
+                read_errors.append(f"{label} {engine or 'auto'}: {repr(e)}")
+        return None
+
+    def _load_original_df(self) -> Optional[pd.DataFrame]:
+        """Full sheet for write-back; loads read only the columns the bot needs"""
+        if self.original_df is None and self._writeback_source is not None and not self._writeback_csv_encoding:
+            src = self._writeback_source
+            if isinstance(src, (bytes, bytearray)):
+                src = BytesIO(src)
+            self.original_df = pd.read_excel(src, engine="openpyxl")
+            self._writeback_source = None
+        return self.original_df
+
+    def _write_csv_statuses(self, path: str):
+        """
+        Copy the source CSV to path row by row with the buffered statuses filled in. Only the
+        status column changes; data rows are counted the way pd.read_csv numbers them.
+        """
+        src = self._writeback_source
+        encoding = self._writeback_csv_encoding
+        if isinstance(src, (bytes, bytearray)):
+            reader_fp = TextIOWrapper(BytesIO(src), encoding=encoding, newline="")
+        else:
+            reader_fp = open(src, encoding=encoding, newline="")
+        fd, tmp = tempfile.mkstemp(suffix=".csv", dir=str(Path(path).resolve().parent))
+        try:
+            with reader_fp, open(fd, "w", encoding=encoding, newline="") as out:
+                reader, writer = csv.reader(reader_fp), csv.writer(out, lineterminator="\n")
+                blank = lambda row: len(row) <= 1 and not "".join(row).strip()  # Skipped by pandas
+                header: List[str] = []
+                for header in reader:
+                    if not blank(header):
+                        break
+                    writer.writerow(header)
+                names = [n.strip() for n in _pandas_header_names(header)]
+                status_col = self._status_col_name if self._status_col_name else "Commented (Y/N)"
+                if status_col in names:
+                    col = names.index(status_col)
+                else:
+                    col = len(header)
+                    header = header + [status_col]
+                writer.writerow(header)
+
+                data_row = 0
+                for row in reader:
+                    if not blank(row):
+                        status = self._csv_statuses.get(data_row)
+                        if status is not None:
+                            row = row + [""] * (col + 1 - len(row))
+                            row[col] = status
+                        data_row += 1
+                    writer.writerow(row)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
     def load_spreadsheet(self, sheet_input: Any) -> pd.DataFrame:
         """Robust spreadsheet loader with improved error handling"""
         self.log_and_callback(f"Loading spreadsheet from: {type(sheet_input).__name__}")
 
         df = None
+        info: Dict[str, Any] = {}
+        partial = False  # True when only the bot's columns were read
         read_errors: List[str] = []
 
         # Case 1: Streamlit UploadedFile or file-like object
@@ -428,27 +1002,25 @@ class XCommentBot:
                     for encoding in ["utf-8", "latin1", "cp1252"]:
                         try:
                             bio.seek(0)
-                            df = pd.read_csv(bio, encoding=encoding)
+                            df, info = self._filter_chunks(self._iter_csv_columns(bio, encoding))
+                            partial = True
+                            self._writeback_source = raw
+                            self._writeback_csv_encoding = encoding
                             self.log_and_callback(f"Successfully read CSV with {encoding} encoding")
                             break
                         except Exception as e:
                             read_errors.append(f"CSV {encoding}: {repr(e)}")
                 else:
-                    # Try different engines for Excel
-                    for engine in ["openpyxl", None, "calamine"]:
-                        try:
-                            bio.seek(0)
-                            if engine == "calamine":
-                                try:
-                                    df = pd.read_excel(bio, engine="calamine")
-                                except ImportError:
-                                    continue  # Skip if calamine not available
-                            else:
-                                df = pd.read_excel(bio, engine=engine)
-                            self.log_and_callback(f"Successfully read Excel with {engine or 'auto'} engine")
-                            break
-                        except Exception as e:
-                            read_errors.append(f"Excel {engine or 'auto'}: {repr(e)}")
+                    try:
+                        df, info = self._filter_chunks(self._iter_excel_columns(bio))
+                        partial = True
+                        self._writeback_source = raw
+                        self.log_and_callback("Successfully read Excel columns")
+                    except Exception as e:
+                        read_errors.append(f"Excel columns: {repr(e)}")
+
+                    if not partial:
+                        df, info = self._filter_full_read(self._read_excel_any(bio, read_errors, "Excel"))
                             
             except Exception as e:
                 read_errors.append(f"File-like object processing: {repr(e)}")
@@ -459,21 +1031,17 @@ class XCommentBot:
                 bio = BytesIO(sheet_input)
                 self._source_desc = "bytes"
                 self.sheet_path = str((Path.cwd() / f"processed_{int(time.time())}.xlsx").resolve())
+
+                try:
+                    df, info = self._filter_chunks(self._iter_excel_columns(bio))
+                    partial = True
+                    self._writeback_source = bytes(sheet_input)
+                    self.log_and_callback("Successfully read bytes columns")
+                except Exception as e:
+                    read_errors.append(f"Bytes columns: {repr(e)}")
                 
-                for engine in ["openpyxl", None, "calamine"]:
-                    try:
-                        bio.seek(0)
-                        if engine == "calamine":
-                            try:
-                                df = pd.read_excel(bio, engine="calamine")
-                            except ImportError:
-                                continue
-                        else:
-                            df = pd.read_excel(bio, engine=engine)
-                        self.log_and_callback(f"Successfully read bytes with {engine or 'auto'} engine")
-                        break
-                    except Exception as e:
-                        read_errors.append(f"Bytes {engine or 'auto'}: {repr(e)}")
+                if not partial:
+                    df, info = self._filter_full_read(self._read_excel_any(bio, read_errors, "Bytes"))
                         
             except Exception as e:
                 read_errors.append(f"Bytes processing: {repr(e)}")
@@ -497,74 +1065,39 @@ class XCommentBot:
                 # Try different encodings for CSV files
                 for encoding in ["utf-8", "latin1", "cp1252"]:
                     try:
-                        df = pd.read_csv(self.sheet_path, encoding=encoding)
+                        df, info = self._filter_chunks(self._iter_csv_columns(self.sheet_path, encoding))
+                        partial = True
+                        self._writeback_source = self.sheet_path
+                        self._writeback_csv_encoding = encoding
                         self.log_and_callback(f"Successfully read CSV with {encoding} encoding")
                         break
                     except Exception as e:
                         read_errors.append(f"CSV {encoding}: {repr(e)}")
             else:
-                # IMPROVED Excel reading with multiple fallback strategies
-                strategies = [
-                    # Strategy 1: Direct pandas read_excel
-                    lambda: pd.read_excel(self.sheet_path, engine="openpyxl"),
-                    # Strategy 2: Open in binary mode first
-                    lambda: pd.read_excel(open(self.sheet_path, "rb"), engine="openpyxl"),
-                    # Strategy 3: Try auto engine
-                    lambda: pd.read_excel(self.sheet_path, engine=None),
-                    # Strategy 4: Binary mode with auto engine
-                    lambda: pd.read_excel(open(self.sheet_path, "rb"), engine=None),
-                    # Strategy 5: Try calamine if available
-                    lambda: pd.read_excel(self.sheet_path, engine="calamine"),
-                    # Strategy 6: Binary mode with calamine
-                    lambda: pd.read_excel(open(self.sheet_path, "rb"), engine="calamine"),
-                ]
-                
-                for i, strategy in enumerate(strategies, 1):
+                try:
+                    df, info = self._filter_chunks(self._iter_excel_columns(self.sheet_path))
+                    partial = True
+                    self._writeback_source = self.sheet_path
+                    self.log_and_callback("Successfully read Excel columns")
+                except Exception as e:
+                    read_errors.append(f"Excel columns: {repr(e)}")
+
+                if not partial:
+                    # Read the file once; every engine retry then parses the same in-memory copy
                     try:
-                        df = strategy()
-                        self.log_and_callback(f"Successfully read Excel with strategy {i}")
-                        break
-                    except ImportError:
-                        if "calamine" in str(strategy):
-                            continue  # Skip calamine if not available
-                    except Exception as e:
-                        read_errors.append(f"Strategy {i}: {repr(e)}")
+                        bio = BytesIO(resolved.read_bytes())
+                    except OSError as e:
+                        read_errors.append(f"Excel file: {repr(e)}")
+                    else:
+                        df, info = self._filter_full_read(self._read_excel_any(bio, read_errors, "Excel"))
 
         if df is None:
             error_msg = "Error reading input file after fallbacks: " + " | ".join(read_errors)
             self.log_and_callback(error_msg, "error")
             raise ValueError(error_msg)
 
-        # Keep a copy for writing status back
-        self.original_df = df.copy()
-
-        # Clean up column names and drop empty unnamed columns
-        df.columns = [str(col).strip() for col in df.columns]  # Remove trailing spaces
-        df = df.loc[:, [c for c in df.columns if not (str(c).startswith("Unnamed") and pd.isna(df[c]).all())]]
-
-        raw_cols = list(df.columns)
-        norm_cols = [self._normalize(c) for c in raw_cols]
-        self.log_and_callback(f"Loaded columns: {raw_cols}")
-        self.log_and_callback(f"Normalized headers: {norm_cols}")
-
-        # Detect URL and comment columns
-        url_col = self._detect_column(norm_cols, raw_cols, "url")
-        comment_col = self._detect_column(norm_cols, raw_cols, "comment")
-
-        # Fallback detection for URL column
-        if url_col is None:
-            for raw in raw_cols:
-                if self._normalize(raw) in ("posturl", "tweet_url", "url", "link"):
-                    url_col = raw
-                    break
-        
-        # Fallback detection for comment column
-        if comment_col is None:
-            for raw in raw_cols:
-                norm = self._normalize(raw)
-                if norm.startswith("generated_comment") or ("comment" in norm) or ("reply" in norm):
-                    comment_col = raw
-                    break
+        roles = info["roles"]
+        url_col, comment_col = roles["url"], roles["comment"]
 
         if (url_col is None) or (comment_col is None):
             missing = []
@@ -579,55 +1112,22 @@ class XCommentBot:
         self.log_and_callback(f"Detected URL column: {url_col}")
         self.log_and_callback(f"Detected comment column: {comment_col}")
 
-        # Standardize column names
-        df["URL"] = df[url_col].astype(str).str.strip()
-        df["generated_comment"] = (
-            df[comment_col]
-            .astype(str)
-            .str.replace("\n", " ")
-            .str.replace("\r", " ")
-            .str.strip()
-        )
-
-        # Optional author column
-        author_like = None
-        for raw in raw_cols:
-            if self._normalize(raw) in ("author", "authorname", "user", "username"):
-                author_like = raw
-                break
-        if author_like is not None:
-            df["authorName"] = df[author_like]
-
         # Detect or create status column
-        status_candidates = {"commented_(y/n)", "commented", "done", "posted", "status"}
-        status_col = None
-        for norm, raw in zip(norm_cols, raw_cols):
-            if norm in status_candidates:
-                status_col = raw
-                break
-        
-        if status_col is None:
-            status_col = "Commented (Y/N)"
-            if status_col not in self.original_df.columns:
+        status_col = info["status_col"]
+        if roles["status"] is None:
+            if self.original_df is not None and status_col not in self.original_df.columns:
                 self.original_df[status_col] = ""
                 self.log_and_callback("Created 'Commented (Y/N)' column (was missing).")
 
-        # Clean and filter data
-        before = len(df)
-        df = df.dropna(subset=["URL", "generated_comment"])
-        df = df[
-            (df["URL"].astype(str).str.len() > 0) &
-            (df["generated_comment"].astype(str).str.len() > 0) &
-            (df["URL"].str.lower() != "nan") &
-            (df["generated_comment"].str.lower() != "nan")
-        ]
-        self.log_and_callback(f"After cleaning empty rows: {before} -> {len(df)}")
-
-        # Filter out already commented rows
-        if status_col in df.columns:
-            already = (df[status_col].astype(str).str.upper().str.strip().isin(["Y", "YES", "TRUE", "1"]))
-            self.log_and_callback(f"Rows already commented (Y/YES/TRUE/1): {already.sum()}")
-            df = df[~already].copy()
+        self.log_and_callback(f"After cleaning empty rows: {info['rows']} -> {info['valid']}")
+        if info["has_status"]:
+            self.log_and_callback(f"Rows already commented (Y/YES/TRUE/1): {info['already']}")
+
+        # Optional author column
+        if roles["author"] is not None:
+            df["authorName"] = df[roles["author"]]
+
+        df = self._compact_dtypes(df, status_col)
 
         self._status_col_name = status_col
 
@@ -635,92 +1135,322 @@ class XCommentBot:
         if len(df) > 0:
             self.log_and_callback("Sample data preview (rows to be processed):")
             for idx, row in df.head(3).iterrows():
-                self.log_and_callback(f"  Row {idx}: URL={str(row['URL'])[:80]}...")
-                self.log_and_callback(f"  Row {idx}: Comment={str(row['generated_comment'])[:80]}...")
+                self.log_and_callback("  Row %s: URL=%.80s...", "info", idx, row["URL"])
+                self.log_and_callback("  Row %s: Comment=%.80s...", "info", idx, row["generated_comment"])
                 if "authorName" in df.columns:
-                    self.log_and_callback(f"  Row {idx}: Author={row['authorName']}")
+                    self.log_and_callback("  Row %s: Author=%s", "info", idx, row["authorName"])
         else:
             self.log_and_callback("No uncommented posts found to process.")
 
         return df
 
+    @staticmethod
+    def _compact_dtypes(df: pd.DataFrame, status_col: Optional[str]) -> pd.DataFrame:
+        """Arrow-backed strings for URL/comment text, categoricals for the low-cardinality columns"""
+        for col in ("URL", "generated_comment"):
+            try:
+                df[col] = df[col].astype("string[pyarrow]")
+            except ImportError:
+                df[col] = df[col].astype("string")
+        for col in (status_col, "authorName"):
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        return df
+
+    def _open_workbook(self):
+        """
+        Open the source workbook once for in-place status writes. Only Excel inputs read by
+        column go this way; other sheets, formatting and formulas are kept as they are.
+        """
+        if self._wb is None and self._writeback_source is not None and not self._writeback_csv_encoding:
+            from openpyxl import load_workbook
+
+            src = self._writeback_source
+            if isinstance(src, (bytes, bytearray)):
+                src = BytesIO(src)
+            self._wb = load_workbook(src)
+            self._ws = self._wb.active
+            self._writeback_source = None
+
+            header = next(self._ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            names = [n.strip() for n in _pandas_header_names(header)]
+            status_col = self._status_col_name if self._status_col_name else "Commented (Y/N)"
+            if status_col in names:
+                self._status_col_idx = names.index(status_col) + 1
+            else:
+                self._status_col_idx = self._ws.max_column + 1
+                self._ws.cell(row=1, column=self._status_col_idx, value=status_col)
+                self.log_and_callback("Created status column in spreadsheet")
+        return self._wb
+
     def update_excel_file(self, row_index: int, status: str):
-        """Update Excel file with improved error handling"""
+        """Record a row's status in memory; written to disk in batches by _flush_excel"""
         try:
-            if self.original_df is None:
+            if self._open_workbook() is not None:
+                # Row 1 is the header, so data row i lives on sheet row i + 2
+                self._ws.cell(row=int(row_index) + 2, column=self._status_col_idx, value=status)
+            elif self._writeback_csv_encoding and self._writeback_source is not None:
+                self._csv_statuses[int(row_index)] = status
+            elif self._load_original_df() is not None:
+                status_col = self._status_col_name if self._status_col_name else "Commented (Y/N)"
+                if status_col not in self.original_df.columns:
+                    self.original_df[status_col] = ""
+                    self.log_and_callback("Created status column in spreadsheet")
+                self.original_df.loc[row_index, status_col] = status
+            else:
                 return
-            
-            status_col = self._status_col_name if self._status_col_name else "Commented (Y/N)"
-            if status_col not in self.original_df.columns:
-                self.original_df[status_col] = ""
-                self.log_and_callback("Created status column in spreadsheet")
 
-            self.original_df.loc[row_index, status_col] = status
+            _LIVE_BOTS.add(self)
+            if self._dirty_rows == 0:
+                self._dirty_since = time.monotonic()
+            self._dirty_rows += 1
+            self.log_and_callback("✓ Row %s marked as '%s'", "info", row_index, status)
+
+            if self._dirty_rows >= self.flush_every or time.monotonic() - self._dirty_since >= FLUSH_INTERVAL:
+                self._flush_excel()
+        except Exception as e:
+            self.log_and_callback(f"Error updating file: {str(e)}", "error")
 
+    def _flush_excel(self):
+        """Write buffered status updates back to the spreadsheet"""
+        if (self._wb is None and self.original_df is None and not self._csv_statuses) or self._dirty_rows == 0:
+            return
+        try:
             out_path = self.sheet_path or str((Path.cwd() / f"processed_{int(time.time())}.xlsx").resolve())
             ext = Path(out_path).suffix.lower()
             
             try:
-                if ext == ".csv":
+                if self._wb is not None:
+                    self._wb.save(out_path)
+                elif self._csv_statuses:
+                    self._write_csv_statuses(out_path)
+                elif ext == ".csv":
                     self.original_df.to_csv(out_path, index=False, encoding="utf-8")
                 else:
-                    # Use openpyxl engine explicitly for better compatibility
-                    self.original_df.to_excel(out_path, index=False, engine="openpyxl")
-                self.log_and_callback(f"✓ Updated file: Row {row_index} marked as '{status}' → {out_path}")
+                    self._write_excel(self.original_df, out_path)
+                self.log_and_callback(f"✓ Updated file: {self._dirty_rows} row(s) written → {out_path}")
             except (OSError, PermissionError) as e:
                 # If writing back to original target fails, write to a new file
                 alt = str((Path.cwd() / f"processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx").resolve())
-                self.original_df.to_excel(alt, index=False, engine="openpyxl")
+                if self._wb is not None:
+                    self._wb.save(alt)
+                elif self._csv_statuses:
+                    alt = str(Path(alt).with_suffix(".csv"))
+                    self._write_csv_statuses(alt)
+                else:
+                    self._write_excel(self.original_df, alt)
                 self.sheet_path = alt
                 self.log_and_callback(f"Write failed to {out_path} ({e}). Wrote to {alt} instead.", "warning")
+            self._dirty_rows = 0
         except Exception as e:
             self.log_and_callback(f"Error updating file: {str(e)}", "error")
 
+    def _write_excel(self, df: pd.DataFrame, path: str):
+        """Serialize df to an .xlsx file with the configured writer backend"""
+        if self.write_backend == "auto":
+            backends = EXCEL_WRITE_BACKENDS
+        else:
+            backends = (self.write_backend, "openpyxl")
+
+        for backend in backends:
+            try:
+                if backend == "pyexcelerate":
+                    from pyexcelerate import Workbook
+                    rows = df.astype(object).where(df.notna(), None).values.tolist()
+                    wb = Workbook()
+                    wb.new_sheet("Sheet1", data=[[str(c) for c in df.columns]] + rows)
+                    wb.save(path)
+                elif backend == "xlsxwriter":
+                    df.to_excel(path, index=False, engine="xlsxwriter")
+                else:
+                    # openpyxl ships with the requirements, so this is the final fallback
+                    df.to_excel(path, index=False, engine="openpyxl")
+                return
+            except ImportError:
+                continue
+
     def process_posts(self, df: pd.DataFrame):
         """Process posts with improved progress reporting"""
+        # Rows already marked done are dropped up front with one vectorized test
+        if self._status_col_name in df.columns:
+            status = df[self._status_col_name].astype("string").str.strip().str.upper()
+            done = status.isin(DONE_STATUSES).to_numpy(dtype=bool, na_value=False)
+            if done.any():
+                self.log_and_callback(f"⏭️  Skipping {int(done.sum())} row(s) already commented")
+                df = df.loc[~done]
+
         if len(df) == 0:
             self.log_and_callback("No posts to process - all rows already commented or no valid data found.")
             return
         
         self.log_and_callback(f"Starting to process {len(df)} uncommented posts...")
+
+        if self.workers > 1 and len(df) > 1:
+            self._process_posts_parallel(df)
+            return
         
-        for idx, row in df.iterrows():
-            url = row["URL"]
-            comment = row["generated_comment"]
-            author_name = row.get("authorName", "Unknown")
-            content_preview = str(row.get("PostText", "") or row.get("content", ""))[:100] + "..." if (row.get("PostText") or row.get("content")) else "No content"
-
-            if (self._status_col_name in row) and (str(row[self._status_col_name]).strip().upper() in {"Y", "YES", "TRUE", "1"}):
-                self.log_and_callback(f"⏭️  Skipping row {idx} - already commented")
+        # Content previews for the log, built column-wise: PostText, else content, else "No content"
+        text = pd.Series("", index=df.index, dtype="string")
+        for col in ("content", "PostText"):
+            if col in df.columns:
+                col_text = df[col].astype("string").fillna("")
+                text = col_text.where(col_text.str.len() > 0, text)
+        previews = (text.str.slice(0, 100) + "...").where(text.str.len() > 0, "No content").tolist()
+
+        # Plain per-column lists zipped together; iterrows would build a Series per row
+        authors = df["authorName"].tolist() if "authorName" in df.columns else ["Unknown"] * len(df)
+        rows = zip(df.index, df["URL"].tolist(), df["generated_comment"].tolist(), authors, previews)
+        # Posts that fail on the first pass go to the back of the queue for one more pass
+        tasks = collections.deque(
+            (number, idx, url, comment, author_name, content_preview, FIRST_PASS_ATTEMPTS)
+            for number, (idx, url, comment, author_name, content_preview) in enumerate(rows, 1)
+        )
+        pacer = PostPacer(self.delay)
+        started = False
+        while tasks:
+            if started:
+                # Let the next posts load in background tabs while we wait
+                self._prefetch_ahead([task[2] for task in itertools.islice(tasks, self.preload_tabs)])
+            pacer.wait(lambda pause: self.log_and_callback("Waiting %.1f seconds before next post...", "info", pause))
+            started = True
+
+            number, idx, url, comment, author_name, content_preview, attempts = tasks.popleft()
+            if attempts == FIRST_PASS_ATTEMPTS:
+                self.log_and_callback("Processing post %d/%d", "info", number, len(df))
+            else:
+                self.log_and_callback("Retrying post %d/%d", "info", number, len(df))
+            self.log_and_callback("  Row Index: %s", "info", idx)
+            self.log_and_callback("  Author: %s", "info", author_name)
+            self.log_and_callback("  Content: %s", "info", content_preview)
+            self.log_and_callback("  URL: %s", "info", url)
+
+            result = self.process_single_post(url, comment, number, idx, attempts)
+            if self._should_retry_later(result, attempts):
+                tasks.append((number, idx, url, comment, author_name, content_preview, RETRY_PASS_ATTEMPTS))
                 continue
-
-            current_post = len(self.results) + 1
-            self.log_and_callback(f"Processing post {current_post}/{len(df)}")
-            self.log_and_callback(f"  Row Index: {idx}")
-            self.log_and_callback(f"  Author: {author_name}")
-            self.log_and_callback(f"  Content: {content_preview}")
-            self.log_and_callback(f"  URL: {url}")
-
-            result = self.process_single_post(url, comment, current_post, idx)
-            self.results.append(result)
+            self._record_result(result)
 
             status = "Y" if result["status"] == "success" else "N"
             self.update_excel_file(idx, status)
 
             # Progress update for UI
             if self.ui_callback:
-                progress = f"Completed {current_post}/{len(df)} posts"
+                progress = f"Completed {len(self.results)}/{len(df)} posts"
                 self.ui_callback(progress)
 
-            if current_post < len(df):
-                delay_time = self.delay + random.uniform(0.5, 1.5)
-                self.log_and_callback(f"Waiting {delay_time:.1f} seconds before next post...")
-                time.sleep(delay_time)
+        self._flush_excel()
+        self.log_and_callback("Finished processing all posts")
 
+    def _process_posts_parallel(self, df: pd.DataFrame):
+        """
+        Post with several browsers at once. Worker threads each drive their own Chrome
+        (the first reuses the logged-in one, the rest get its cookies) and pull tasks from
+        a shared queue; this thread records results, writes statuses and reports progress.
+        """
+        n_workers = min(self.workers, len(df))
+        self.log_and_callback(f"Using {n_workers} parallel browsers")
+
+        tasks: "queue.Queue[Tuple[int, Any, str, str, int]]" = queue.Queue()
+        for number, (idx, url, comment) in enumerate(zip(df.index, df["URL"], df["generated_comment"]), 1):
+            tasks.put((number, idx, url, comment, FIRST_PASS_ATTEMPTS))
+        done: "queue.Queue[Optional[Dict]]" = queue.Queue()
+        cookies = self.driver.get_cookies()
+        pacer = PostPacer(self.delay)
+
+        def work(slot: int):
+            worker = None
+            try:
+                worker = self._make_worker(cookies if slot else None)
+                while True:
+                    try:
+                        task = tasks.get_nowait()
+                    except queue.Empty:
+                        break
+                    number, idx, url, comment, attempts = task
+                    pacer.wait()
+                    result = worker.process_single_post(url, comment, number, idx, attempts)
+                    if result["status"] != "success" and not worker._driver_alive():
+                        # A dead browser would fail every remaining post; hand this one to a live worker
+                        tasks.put(task)
+                        raise WebDriverException("browser session was lost")
+                    if worker._should_retry_later(result, attempts):
+                        tasks.put((number, idx, url, comment, RETRY_PASS_ATTEMPTS))
+                        continue
+                    done.put(result)
+            except Exception as e:
+                self.logger.error(f"Worker {slot} stopped: {e}")
+            finally:
+                if slot and worker is not None:
+                    worker.cleanup()
+                done.put(None)
+
+        threads = [threading.Thread(target=work, args=(slot,), name=f"worker-{slot}", daemon=True)
+                   for slot in range(n_workers)]
+        for t in threads:
+            t.start()
+
+        finished = 0
+        while finished < n_workers:
+            result = done.get()
+            if result is None:
+                finished += 1
+                continue
+            self._record_result(result)
+            self.update_excel_file(result["original_index"], "Y" if result["status"] == "success" else "N")
+            if self.ui_callback:
+                # Workers only write to the log file, so surface each outcome here
+                mark = "✓" if result["status"] == "success" else "✗"
+                self.ui_callback(f"{mark} Post {result['post_number']}: {result['message']}")
+                self.ui_callback(f"Completed {len(self.results)}/{len(df)} posts")
+
+        for t in threads:
+            t.join()
+        if not tasks.empty():
+            self.log_and_callback(f"{tasks.qsize()} posts were not attempted because all browsers stopped", "error")
+
+        self._flush_excel()
         self.log_and_callback("Finished processing all posts")
 
-    def process_single_post(self, url: str, comment: str, post_number: int, original_index: int) -> Dict:
-        """Process a single post with improved error handling"""
+    def _driver_alive(self) -> bool:
+        """True while the browser session still answers WebDriver commands."""
+        try:
+            self.driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def _make_worker(self, cookies: Optional[List[Dict]]) -> "XCommentBot":
+        """
+        Lightweight copy of this bot for one worker thread. Without cookies it shares the
+        logged-in driver; otherwise it starts its own Chrome and copies the session over.
+        """
+        worker = copy.copy(self)
+        worker.ui_callback = None  # UI updates stay on the coordinating thread
+        worker.results = []
+        worker._sel_cache = dict.fromkeys(self._sel_cache)
+        worker._prefetched = collections.deque()
+        if cookies is None:
+            return worker
+
+        worker.profile_path = None  # A profile directory can only be open in one Chrome
+        worker.setup_chrome_driver()
+        worker.block_heavy_media()
+        worker.driver.get("https://x.com/")
+        for cookie in cookies:
+            try:
+                worker.driver.add_cookie(cookie)
+            except WebDriverException:
+                pass
+        worker.work_window = worker.driver.current_window_handle
+        worker._work_tab_focused = True
+        return worker
+
+    def process_single_post(self, url: str, comment: str, post_number: int, original_index: int,
+                            max_retries: int = FIRST_PASS_ATTEMPTS) -> Dict:
+        """
+        Process a single post with improved error handling. result["retryable"] is False when
+        the failure is one another attempt cannot fix (missing post, lost session, ...).
+        """
         result = {
             "post_number": post_number,
             "original_index": original_index,
@@ -728,16 +1458,27 @@ class XCommentBot:
             "comment": comment[:50] + "..." if len(comment) > 50 else comment,
             "status": "failed",
             "message": "",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat(),
+            "retryable": True,
         }
         
-        max_retries = 3
         for attempt in range(max_retries):
             try:
-                self.driver.execute_script("window.open('');")
-                self.driver.switch_to.window(self.driver.window_handles[-1])
-                self.driver.get(url)
-                time.sleep(3)
+                if not (attempt == 0 and self._adopt_prefetched(url)):
+                    self._switch_to_work_tab()
+                    self.driver.get(url)
+                try:
+                    WebDriverWait(self.driver, PROBE_FALLBACK_TIMEOUT, poll_frequency=PROBE_POLL).until(PAGE_READY)
+                except TimeoutException:
+                    self.log_and_callback(f"Post {post_number}: page layout not detected, trying anyway", "warning")
+
+                problem = self._permanent_page_problem()
+                if problem:
+                    # Retrying cannot fix a missing post or a lost session
+                    result["message"] = problem
+                    result["retryable"] = False
+                    self.log_and_callback(f"✗ Post {post_number}: {problem} - not retrying", "error")
+                    break
                 
                 if self.post_comment(comment):
                     result["status"] = "success"
@@ -750,78 +1491,144 @@ class XCommentBot:
             except Exception as e:
                 error_msg = f"Error on attempt {attempt + 1}: {str(e)}"
                 result["message"] = error_msg
+                self._work_tab_focused = False  # The tab may be gone; re-check before reuse
                 self.log_and_callback(f"✗ Post {post_number}: {error_msg}", "error")
+                if not isinstance(e, RETRYABLE_ERRORS):
+                    result["retryable"] = False
+                    break
                 
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     self.log_and_callback(f"Retrying in {wait_time} seconds...")
                     time.sleep(wait_time)
-            finally:
-                try:
-                    self.driver.close()
-                    self.driver.switch_to.window(self.main_window)
-                except Exception:
-                    pass
                     
         return result
 
+    def _should_retry_later(self, result: Dict, attempts: int) -> bool:
+        """True for a retryable first-pass failure, which is queued again behind the other posts."""
+        if result["status"] == "success" or not result["retryable"] or attempts != FIRST_PASS_ATTEMPTS:
+            return False
+        self.log_and_callback(f"Post {result['post_number']} will be retried after the remaining posts", "warning")
+        return True
+
+    def _permanent_page_problem(self) -> Optional[str]:
+        """Describe a loaded page that can never be commented on, or None if it looks usable."""
+        try:
+            return self.driver.execute_script(PAGE_PROBLEM_JS)
+        except WebDriverException:
+            return None
+
+    def _prefetch_ahead(self, upcoming: List[str]):
+        """Keep up to preload_tabs upcoming posts loading in background tabs of this driver."""
+        queued = {u for u, _ in self._prefetched}
+        for url in upcoming:
+            if url in queued:
+                continue
+            try:
+                before = set(self.driver.window_handles)
+                self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+                opened = set(self.driver.window_handles) - before
+                if opened:
+                    self._prefetched.append((url, opened.pop()))
+                    queued.add(url)
+            except WebDriverException as e:
+                self.log_and_callback(f"Could not preload upcoming post: {e}", "warning")
+                break
+
+    def _adopt_prefetched(self, url: str) -> bool:
+        """
+        Make the preloaded tab for url the work tab, closing the previous one and any skipped preloads.
+        While preloading keeps up, every post gets a fresh tab this way and the reused work tab of
+        _switch_to_work_tab only serves the first post, retries and runs without preloading.
+        """
+        if url not in {u for u, _ in self._prefetched}:
+            return False
+        try:
+            while True:
+                queued_url, handle = self._prefetched.popleft()
+                if queued_url == url:
+                    break
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            if self.work_window is not None and self.work_window != handle:
+                self.driver.switch_to.window(self.work_window)
+                self.driver.close()
+            self.driver.switch_to.window(handle)
+            self.work_window = handle
+            self._work_tab_uses = 1
+            self._work_tab_focused = True
+            return True
+        except WebDriverException:
+            # Focus may be left on a tab closed above; _switch_to_work_tab opens the next one from a live tab
+            self.work_window = None
+            self._work_tab_focused = False
+            self._focus_live_window()
+            return False
+
+    def _switch_to_work_tab(self):
+        """
+        Focus the tab every post is loaded into, opening a fresh one only if it was closed
+        or has served MAX_USES_PER_TAB posts. Background preloads never move the driver's
+        focus, so the switch is skipped while the work tab is already focused.
+        """
+        stale = None
+        if self.work_window is not None:
+            try:
+                if not self._work_tab_focused:
+                    self.driver.switch_to.window(self.work_window)
+                    self._work_tab_focused = True
+                if self._work_tab_uses < MAX_USES_PER_TAB:
+                    self._work_tab_uses += 1
+                    return
+                stale = self.work_window
+            except WebDriverException:
+                self.log_and_callback("Work tab was closed, opening a new one", "warning")
+                self.work_window = None
+                self._work_tab_focused = False
+                self._focus_live_window()  # window.open needs a live tab to run in
+        # Preload tabs may be open too and handle order is not guaranteed, so diff the sets
+        before = set(self.driver.window_handles)
+        self.driver.execute_script("window.open('');")
+        opened = set(self.driver.window_handles) - before
+        if not opened:
+            raise WebDriverException("could not open a new work tab")
+        self.work_window = opened.pop()
+        if stale is not None:
+            self.driver.close()  # Still focused; the new tab keeps the session alive
+        self.driver.switch_to.window(self.work_window)
+        self._work_tab_uses = 1
+        self._work_tab_focused = True
+
+    def _focus_live_window(self):
+        """Move the driver off a closed tab: to the login tab if still open, else any non-preload tab."""
+        handles = self.driver.window_handles
+        if not handles:
+            raise WebDriverException("browser has no open windows")
+        if self.main_window in handles:
+            self.driver.switch_to.window(self.main_window)
+            return
+        preloads = {handle for _, handle in self._prefetched}
+        self.driver.switch_to.window(next((h for h in handles if h not in preloads), handles[0]))
+
     def post_comment(self, comment: str) -> bool:
-        """Post comment with improved element detection"""
+        """
+        Post comment with improved element detection. The text arrives single-line and
+        stripped: load_spreadsheet cleans the whole comment column once.
+        """
         try:
-            comment = comment.replace("\n", " ").replace("\r", " ").strip()
             self.log_and_callback(f"Attempting to post comment: {comment[:50]}...")
 
-            # Find reply button with improved selectors
-            reply_button_selectors = [
-                "[data-testid='reply']",
-                "[aria-label*='Reply']",
-                "[data-testid='tweetButtonInline']",
-                "button[aria-label*='Reply']"
-            ]
-            
-            reply_button = None
-            for selector in reply_button_selectors:
-                try:
-                    reply_button = WebDriverWait(self.driver, 15).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    self.log_and_callback(f"Found reply button with selector: {selector}")
-                    break
-                except TimeoutException:
-                    self.log_and_callback(f"Reply button selector {selector} not found, trying next...")
-                    continue
+            reply_button = self._find_clickable("reply", REPLY_LOCATORS, "reply button")
                     
             if reply_button is None:
                 self.log_and_callback("Could not find reply button", "error")
                 return False
 
             # Scroll to and click reply button
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", reply_button)
-            time.sleep(1)
             self.log_and_callback("Clicking reply button...")
-            reply_button.click()
-            time.sleep(2)
-
-            # Find compose area with improved selectors
-            compose_selectors = [
-                "[data-testid='tweetTextarea_0']",
-                "[contenteditable='true'][role='textbox']",
-                ".public-DraftEditor-content",
-                "[aria-label*='Post your reply']",
-                "[placeholder*='Post your reply']",
-                "div[contenteditable='true']"
-            ]
-            
-            compose_area = None
-            for selector in compose_selectors:
-                try:
-                    compose_area = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    self.log_and_callback(f"Found compose area with selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
+            self.driver.execute_script(SCROLL_CLICK_JS, reply_button)
+
+            compose_area = self._find_clickable("compose", COMPOSE_LOCATORS, "compose area")
                     
             if compose_area is None:
                 self.log_and_callback("Could not find compose text area", "error")
@@ -830,43 +1637,50 @@ class XCommentBot:
             # Input comment text with multiple fallback methods
             self.log_and_callback("Clicking on compose area...")
             compose_area.click()
-            time.sleep(1)
 
             self.log_and_callback("Inputting comment text...")
             input_success = False
             
-            # Method 1: Standard send_keys
-            try:
-                compose_area.clear()
-                compose_area.send_keys(comment)
+            # Method 1: CDP Input.insertText - the whole comment in one command
+            if self._insert_text(compose_area, comment):
                 input_success = True
-                self.log_and_callback("Comment text entered successfully using send_keys")
-            except Exception as e:
-                self.log_and_callback(f"send_keys method failed: {e}", "warning")
-                
-                # Method 2: ActionChains
+                self.log_and_callback("Comment text entered using Input.insertText")
+            elif not self._clear_compose(compose_area):
+                # Typing again on top of what insertText left would post the comment twice over
+                self.log_and_callback("Could not clear the compose area for another input method", "error")
+                return False
+            else:
+                # Method 2: Standard send_keys
                 try:
-                    actions = ActionChains(self.driver)
-                    actions.click(compose_area)
-                    actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL)
-                    actions.send_keys(comment)
-                    actions.perform()
+                    compose_area.send_keys(comment)
                     input_success = True
-                    self.log_and_callback("Comment text entered using ActionChains")
-                except Exception as e2:
-                    self.log_and_callback(f"ActionChains method failed: {e2}", "warning")
-                    
-                    # Method 3: JavaScript
+                    self.log_and_callback("Comment text entered successfully using send_keys")
+                except Exception as e:
+                    self.log_and_callback(f"send_keys method failed: {e}", "warning")
+                
+                    # Method 3: ActionChains
                     try:
-                        self.driver.execute_script(
-                            "arguments[0].innerText = arguments[1]; arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
-                            compose_area,
-                            comment
-                        )
+                        actions = ActionChains(self.driver)
+                        actions.click(compose_area)
+                        actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL)
+                        actions.send_keys(comment)
+                        actions.perform()
                         input_success = True
-                        self.log_and_callback("Comment text entered using JavaScript")
-                    except Exception as e3:
-                        self.log_and_callback(f"JavaScript method failed: {e3}", "error")
+                        self.log_and_callback("Comment text entered using ActionChains")
+                    except Exception as e2:
+                        self.log_and_callback(f"ActionChains method failed: {e2}", "warning")
+                    
+                        # Method 4: JavaScript
+                        try:
+                            self.driver.execute_script(
+                                "arguments[0].innerText = arguments[1]; arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
+                                compose_area,
+                                comment
+                            )
+                            input_success = True
+                            self.log_and_callback("Comment text entered using JavaScript")
+                        except Exception as e3:
+                            self.log_and_callback(f"JavaScript method failed: {e3}", "error")
 
             if not input_success:
                 self.log_and_callback("Failed to input comment text with all methods", "error")
@@ -874,78 +1688,111 @@ class XCommentBot:
 
             # Find and click post button
             self.log_and_callback("Waiting for Post/Reply button to become enabled...")
-            time.sleep(2)
-            
-            post_button_selectors = [
-                "[data-testid='tweetButton']",
-                "[data-testid='tweetButtonInline']",
-                "button[role='button']",
-                "[aria-label*='Reply']",
-                "[aria-label*='Post']"
-            ]
             
-            post_button = None
-            for selector in post_button_selectors:
-                try:
-                    if selector == "button[role='button']":
-                        xpath_selector = "//button[not(@disabled) and (contains(., 'Reply') or contains(., 'Post'))]"
-                        post_button = WebDriverWait(self.driver, 8).until(
-                            EC.element_to_be_clickable((By.XPATH, xpath_selector))
-                        )
-                    else:
-                        post_button = WebDriverWait(self.driver, 8).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                    
-                    if post_button.is_enabled():
-                        self.log_and_callback(f"Found enabled post button with selector: {selector}")
-                        break
-                    else:
-                        self.log_and_callback(f"Post button found but disabled: {selector}")
-                        post_button = None
-                except TimeoutException:
-                    self.log_and_callback(f"Post button selector '{selector}' not found, trying next...")
-                    continue
+            # Fast path: locate, check and click the usual post button in one round trip
+            clicked = self.driver.execute_script(POST_CLICK_JS, "[data-testid='tweetButton']")
+            if clicked == "ok":
+                self.log_and_callback("Clicked Post/Reply button")
+            else:
+                post_button = self._find_clickable("post", POST_LOCATORS, "enabled post button")
                     
-            if post_button is None:
-                self.log_and_callback("Could not find enabled Post/Reply button", "error")
-                return False
+                if post_button is None:
+                    self.log_and_callback("Could not find enabled Post/Reply button", "error")
+                    return False
 
-            # Click post button
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", post_button)
-            time.sleep(1)
-            self.log_and_callback("Clicking Post/Reply button...")
-            post_button.click()
+                # Click post button
+                self.log_and_callback("Clicking Post/Reply button...")
+                self.driver.execute_script(SCROLL_CLICK_JS, post_button)
 
             # Wait and verify posting
             self.log_and_callback("Waiting for comment to be posted...")
-            time.sleep(5)
+            try:
+                # The compose box closes once X accepts the reply
+                WebDriverWait(self.driver, 8, poll_frequency=PROBE_POLL).until(
+                    EC.invisibility_of_element_located((By.CSS_SELECTOR, "[data-testid='tweetTextarea_0']"))
+                )
+            except TimeoutException:
+                self.log_and_callback("Compose box still open after posting", "warning")
             
             try:
-                success_indicators = ["[data-testid='tweet']", "[data-testid='cellInnerDiv']"]
-                for indicator in success_indicators:
-                    try:
-                        WebDriverWait(self.driver, 3).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, indicator))
-                        )
-                        self.log_and_callback(f"Comment posting verified via: {indicator}")
-                        break
-                    except TimeoutException:
-                        continue
+                WebDriverWait(self.driver, PROBE_TIMEOUT, poll_frequency=PROBE_POLL).until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "[data-testid='tweet'], [data-testid='cellInnerDiv']")
+                    )
+                )
+                self.log_and_callback("Comment posting verified via timeline elements")
+            except TimeoutException:
+                pass
             except Exception as e:
                 self.log_and_callback(f"Could not verify comment posting: {e}", "warning")
 
             self.log_and_callback("Comment posting process completed successfully")
             return True
 
+        except StaleElementReferenceException as e:
+            # The page re-rendered under us; re-resolve every selector on the next post
+            self._sel_cache = dict.fromkeys(self._sel_cache)
+            self.log_and_callback(f"Error posting comment (stale element): {str(e)}", "error")
+            return False
         except Exception as e:
             self.log_and_callback(f"Error posting comment: {str(e)}", "error")
             return False
 
+    def _insert_text(self, compose_area, comment: str) -> bool:
+        """Type into the focused compose area via CDP and confirm the text actually landed."""
+        try:
+            self._cdp("Input.insertText", {"text": comment})
+            typed = self.driver.execute_script(
+                "var el = arguments[0]; return (el.innerText || el.value || '').replace(/\\s+/g, ' ').trim();",
+                compose_area
+            )
+        except WebDriverException as e:
+            self.log_and_callback(f"Input.insertText failed: {e}", "warning")
+            return False
+        return typed == " ".join(comment.split())
+
+    def _clear_compose(self, compose_area) -> bool:
+        """Empty the compose area before a fallback input method; False if text is still there."""
+        try:
+            return self.driver.execute_script(CLEAR_COMPOSE_JS, compose_area) == 0
+        except WebDriverException as e:
+            self.log_and_callback(f"Clearing the compose area failed: {e}", "warning")
+            return False
+
+    def _find_clickable(self, key: str, locators: Iterable[Tuple[str, str]], label: str):
+        """
+        Return the first visible, enabled element for a post_comment step.
+        Tries the locator that worked last time on a short wait, then every candidate in
+        priority order; one script call per poll checks all of them.
+        """
+        locators = list(locators)
+        cached = self._sel_cache.get(key)
+        attempts = [([cached], PROBE_TIMEOUT)] if cached is not None else []
+        attempts.append((locators, PROBE_FALLBACK_TIMEOUT))
+        for candidates, timeout in attempts:
+            payload = [[by, sel] for by, sel in candidates]
+            try:
+                element, index = WebDriverWait(self.driver, timeout, poll_frequency=PROBE_POLL).until(
+                    lambda driver: driver.execute_script(FIND_CLICKABLE_JS, payload) or False
+                )
+            except TimeoutException:
+                continue
+            locator = candidates[index]
+            if locator == cached:
+                self.log_and_callback("Found %s with cached selector: %s", "debug", label, locator[1])
+            else:
+                self._sel_cache[key] = locator
+                self.log_and_callback(f"Found {label} with selector: {locator[1]}")
+            return element
+
+        self._sel_cache[key] = None
+        self.log_and_callback(f"No {label} selector matched", "warning")
+        return None
+
     def generate_summary_report(self) -> str:
         """Generate summary report"""
         total_posts = len(self.results)
-        successful_posts = len([r for r in self.results if r["status"] == "success"]) 
+        successful_posts = self._success_count
         failed_posts = total_posts - successful_posts
         success_rate = (successful_posts / total_posts * 100) if total_posts > 0 else 0
         
@@ -964,23 +1811,41 @@ Session completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Note: Posts already marked as 'Y' were automatically skipped.
 """
         if failed_posts > 0:
-            summary += "\nFailed Posts:\n"
-            for result in self.results:
-                if result["status"] == "failed":
-                    summary += f"- Post {result['post_number']} (Row {result['original_index']}): {result['message']}\n"
+            summary += "\nFailed Posts:\n" + "".join(
+                f"- Post {result['post_number']} (Row {result['original_index']}): {result['message']}\n"
+                for result in self.results if result["status"] == "failed"
+            )
         return summary
 
+    def _record_result(self, result: Dict):
+        """Keep a post result and append it to the results CSV straight away."""
+        self.results.append(result)
+        if result["status"] == "success":
+            self._success_count += 1
+        if self._results_writer is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self._results_file = f"x_results_{timestamp}.csv"
+            self._results_fp = open(self._results_file, "w", newline="", encoding="utf-8")
+            self._results_writer = csv.DictWriter(self._results_fp, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+            self._results_writer.writeheader()
+        self._results_writer.writerow(result)
+        self._results_fp.flush()  # Rows survive a crash mid-run
+
+    def _close_results(self):
+        if self._results_fp is not None:
+            self._results_fp.close()
+            self._results_fp = None
+            self._results_writer = None
+
     def save_results(self) -> str:
-        """Save results to CSV"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        results_file = f"x_results_{timestamp}.csv"
-        df_results = pd.DataFrame(self.results)
-        df_results.to_csv(results_file, index=False)
-        self.log_and_callback(f"Results saved to: {results_file}")
-        return results_file
+        """Finish the results CSV written during the run and return its name"""
+        self._close_results()
+        self.log_and_callback(f"Results saved to: {self._results_file}")
+        return self._results_file
 
     def cleanup(self):
         """Clean up resources"""
+        self._close_results()
         if self.driver:
             try:
                 self.driver.quit()
@@ -1001,6 +1866,10 @@ Note: Posts already marked as 'Y' were automatically skipped.
             if not self.wait_for_manual_login():
                 self.log_and_callback("Login confirmation failed. Exiting...", "error")
                 return 2
+            # Posts are loaded one after another into the logged-in tab
+            self.work_window = self.driver.current_window_handle
+            self._work_tab_focused = True
+            self.block_heavy_media()
 
             df = self.load_spreadsheet(sheet_path)
             if len(df) == 0:
@@ -1016,8 +1885,7 @@ Note: Posts already marked as 'Y' were automatically skipped.
             if len(self.results) > 0:
                 _ = self.save_results()
 
-            successful = len([r for r in self.results if r["status"] == "success"]) > 0
-            if successful:
+            if self._success_count > 0:
                 return 0
             else:
                 return 3
@@ -1029,6 +1897,7 @@ Note: Posts already marked as 'Y' were automatically skipped.
             self.log_and_callback(f"Fatal error: {str(e)}", "error")
             return 1
         finally:
+            self._flush_excel()  # Persist statuses recorded before an error
             self.cleanup()
 
 
@@ -1052,15 +1921,42 @@ Features:
     )
     parser.add_argument("--sheet", required=True, help="Path to .xlsx or .csv with X post data")
     parser.add_argument("--delay", type=float, default=2.0, help="Seconds to sleep between actions (default: 2.0)")
-    parser.add_argument("--profile", help="Path to Chrome profile directory (optional)")
+    parser.add_argument("--profile",
+                        help=f"Chrome profile directory kept between runs (default: {DEFAULT_PROFILE_DIR}; "
+                             "with --remote-url, none unless given as a path on the driver's host)")
+    parser.add_argument("--fresh-profile", action="store_true",
+                        help="Use a throwaway profile instead, logging in from scratch")
     parser.add_argument("--headless", action="store_true", help="Run Chrome in headless mode")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of browsers posting in parallel (default: 1)")
+    parser.add_argument("--preload-tabs", type=int, default=1,
+                        help="Upcoming posts to load in background tabs while waiting; each post then runs in "
+                             "its own preloaded tab instead of one reused tab (default: 1, 0 disables)")
+    parser.add_argument("--load-media", action="store_true",
+                        help="Keep loading images and video on post pages (blocked by default)")
+    parser.add_argument("--write-backend", default="auto", choices=("auto",) + EXCEL_WRITE_BACKENDS,
+                        help="Excel writer for whole-sheet saves when the workbook cannot be edited in place (default: fastest installed)")
+    parser.add_argument("--flush-every", type=int, default=25,
+                        help="Save statuses to the sheet after this many posts (default: 25; also every "
+                             f"{FLUSH_INTERVAL:.0f}s and on exit)")
+    parser.add_argument("--remote-url",
+                        help="Reuse a running chromedriver (e.g. http://localhost:9515) instead of starting one")
     args = parser.parse_args()
 
     if not (args.sheet.lower().endswith(".xlsx") or args.sheet.lower().endswith(".csv")):
         print("Error: This script works with .xlsx or .csv files")
         sys.exit(1)
 
-    bot = XCommentBot(delay=args.delay, profile_path=args.profile, headless=args.headless)
+    # Turn SIGTERM into a normal exit so atexit still writes any buffered statuses
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
+    # The default profile is a local path, meaningless to a chromedriver on another host
+    profile = args.profile or (None if args.remote_url else DEFAULT_PROFILE_DIR)
+    bot = XCommentBot(delay=args.delay, profile_path=None if args.fresh_profile else profile,
+                      headless=args.headless,
+                      flush_every=args.flush_every, write_backend=args.write_backend, workers=args.workers,
+                      block_media=not args.load_media, preload_tabs=args.preload_tabs,
+                      remote_url=args.remote_url)
     exit_code = bot.run(args.sheet)
     sys.exit(exit_code)
 